@@ -24,6 +24,7 @@ Middleware Components:
     - RequestLoggingMiddleware: HTTP request and response logging
     - ErrorHandlingMiddleware: Centralized error handling and formatting
     - LocalizationMiddleware: Multi-language support and localization
+    - RequestBodyLimitMiddleware: Per-route request body size limits at ingress
 
 Middleware Stack Order (applied in reverse order):
     1. ErrorHandlingMiddleware (outermost - catches all errors)
@@ -0,0 +1,117 @@
+# 📄 File: app/api/middleware/body_limit.py
+# 🧭 Purpose (Layman Explanation):
+# Stops oversized uploads (like huge profile photos) at the door, before the server spends
+# time and disk space receiving the whole file.
+# 🧪 Purpose (Technical Summary):
+# Pure ASGI middleware that enforces per-route request body size limits, rejecting requests
+# with an oversized Content-Length up front and aborting chunked bodies once they exceed the limit.
+# 🔗 Dependencies:
+# starlette types and responses, re, typing
+# 🔄 Connected Modules / Calls From:
+# app.main.py middleware registration
+
+import logging
+import re
+from typing import Optional, Sequence, Tuple
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Headroom for multipart boundaries and part headers around an uploaded file
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class RequestBodyLimitMiddleware:
+    """
+    Request body size limits for selected routes.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware so the limit
+    applies while the body is being received. Form parsing in the route
+    (e.g. ``UploadFile = File(...)``) happens before any dependency runs,
+    so a route-level check would only see the body after it was spooled.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Sequence[Tuple[str, str, int]]):
+        """
+        Args:
+            app: Wrapped ASGI application
+            limits: ``(method, path regex, max body bytes)`` entries
+        """
+        self.app = app
+        self.limits = tuple(
+            (method.upper(), re.compile(pattern), max_bytes)
+            for method, pattern, max_bytes in limits
+        )
+
+    def _limit_for(self, method: str, path: str) -> Optional[int]:
+        """Return the body limit for a request, None if the route is unlimited."""
+        for limit_method, pattern, max_bytes in self.limits:
+            if limit_method == method and pattern.match(path):
+                return max_bytes
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = self._limit_for(scope["method"], scope["path"])
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > max_bytes:
+                    await self._reject(scope, receive, send, max_bytes)
+                    return
+                break
+
+        received = 0
+        response_started = False
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    # Answer now and tell the app the client went away; an
+                    # exception here would be reshaped by the inner handlers
+                    rejected = True
+                    if not response_started:
+                        await self._reject(scope, receive, send, max_bytes)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not rejected:
+                raise
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, max_bytes: int) -> None:
+        """Send a 413 without reading the rest of the body."""
+        logger.warning(
+            "Request body over %s bytes rejected: %s %s", max_bytes, scope["method"], scope["path"]
+        )
+        response = ORJSONResponse(
+            status_code=413,
+            content={"detail": f"Request body must not exceed {max_bytes} bytes"},
+            headers={"Connection": "close"},
+        )
+        await response(scope, receive, send)
@@ -27,7 +27,7 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.api.v1.router import _get_available_modules
 
 import uvicorn
@@ -41,6 +41,7 @@ from app.api.middleware.logging import RequestLoggingMiddleware
 from app.api.middleware.error_handling import ErrorHandlingMiddleware
 from app.api.middleware.cors import PlantCareCORSMiddleware
 from app.api.middleware.localization import LocalizationMiddleware
+from app.api.middleware.body_limit import MULTIPART_OVERHEAD_BYTES, RequestBodyLimitMiddleware
 from app.api.v1.router import api_v1_router
 from app.api.v1.health import health_router
 # Import the blueprint (UserRepository) and the real implementation (UserRepositoryImpl)
@@ -117,6 +118,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await init_api_clients()
         logger.info("✅ External API clients initialized")
         
+        # Pre-generate OAuth CSRF state values
+        from app.modules.user_management.infrastructure.external.oauth_providers import fill_oauth_state_pool
+        fill_oauth_state_pool()
+        logger.info("✅ OAuth state pool filled")
+        
         # Start background tasks monitoring
         logger.info("✅ Plant Care API startup complete")
         
@@ -173,6 +179,7 @@ def create_application() -> FastAPI:
         openapi_url="/openapi.json" if settings.DEBUG else None,
         lifespan=lifespan,
         debug=settings.DEBUG,
+        default_response_class=ORJSONResponse,
     )
     
     # =========================================================================
@@ -194,6 +201,17 @@ def create_application() -> FastAPI:
         admin_rate_limit=settings.ADMIN_RATE_LIMIT,
     )
     
+    # Request body limits (inside both CORS layers, so a 413 still carries
+    # CORS headers, and outside request logging, which may read the body)
+    app.add_middleware(
+        RequestBodyLimitMiddleware,
+        limits=[(
+            "POST",
+            r"^/api/v1/profiles/[^/]+/photo$",
+            settings.MAX_IMAGE_SIZE + MULTIPART_OVERHEAD_BYTES,
+        )],
+    )
+    
     # CORS Middleware (should be early in the stack)
     app.add_middleware(PlantCareCORSMiddleware)
 
@@ -246,9 +264,9 @@ def create_application() -> FastAPI:
     async def plant_care_exception_handler(
         request: Request, 
         exc: PlantCareException
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle custom Plant Care application exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": {
@@ -262,9 +280,9 @@ def create_application() -> FastAPI:
         )
     
     @app.exception_handler(404)
-    async def not_found_handler(request: Request, exc) -> JSONResponse:
+    async def not_found_handler(request: Request, exc) -> ORJSONResponse:
         """Handle 404 Not Found errors."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=404,
             content={
                 "error": {
@@ -280,11 +298,11 @@ def create_application() -> FastAPI:
     async def internal_server_error_handler(
         request: Request, 
         exc: Exception
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle 500 Internal Server Error."""
-        logger.error(f"Internal server error: {exc}", exc_info=True)
+        logger.exception("Internal server error: %s", exc)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
@@ -299,8 +317,8 @@ def create_application() -> FastAPI:
 
 
     @app.exception_handler(404)
-    async def v1_not_found_handler(request: Request, exc) -> JSONResponse:
-        return JSONResponse(
+    async def v1_not_found_handler(request: Request, exc) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=404,
             content={
                 "error": {
@@ -351,12 +369,17 @@ def main():
     Main function for running the application in development.
     
     This function is used when running the application directly
-    with python -m app.main or as a script entry point.
+    with python -m app.main or as a script entry point. It pins the
+    uvloop event loop and httptools parser from uvicorn[standard] so a
+    missing extra fails at startup instead of silently falling back to
+    the slower asyncio/h11 implementations.
     """
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
+        loop="uvloop",
+        http="httptools",
         reload=settings.RELOAD and settings.ENVIRONMENT == "development",
         log_level=settings.LOG_LEVEL.lower(),
         workers=1 if settings.RELOAD else settings.WORKERS,
@@ -4,7 +4,7 @@
 # 🧪 Purpose (Technical Summary): 
 # Package initialization for user management module implementing domain-driven design with CQRS pattern for user authentication, profiles, and subscription management
 # 🔗 Dependencies: 
-# FastAPI, SQLAlchemy, app.shared.core, pydantic, passlib
+# FastAPI, SQLAlchemy, app.shared.core, pydantic, bcrypt
 # 🔄 Connected Modules / Calls From: 
 # app.main.py, authentication middleware, all user-related API endpoints
 
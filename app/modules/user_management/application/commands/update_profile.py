@@ -49,6 +49,15 @@ from uuid import UUID
 from pydantic import BaseModel, Field, validator, HttpUrl
 
 
+# Clear flags and the nullable profile column each one resets
+_CLEAR_FLAG_FIELDS = {
+    "clear_bio": "bio",
+    "clear_location": "location",
+    "clear_timezone": "timezone",
+    "clear_profile_photo": "profile_photo",
+}
+
+
 class UpdateProfileCommand(BaseModel):
     """
     Command for updating an existing user profile.
@@ -293,45 +302,20 @@ class UpdateProfileCommand(BaseModel):
         Returns:
             dict: Dictionary of fields to update with their new values
         """
-        update_data = {}
-        
-        # Add non-None fields to update
-        if self.display_name is not None:
-            update_data["display_name"] = self.display_name
-        
-        if self.profile_photo is not None:
-            update_data["profile_photo"] = self.profile_photo
-        
-        if self.bio is not None:
-            update_data["bio"] = self.bio
-        
-        if self.location is not None:
-            update_data["location"] = self.location
-        
-        if self.timezone is not None:
-            update_data["timezone"] = self.timezone
+        # Only walk the fields the caller explicitly set; a one-field edit
+        # produces a one-key dump instead of checking every optional field.
+        set_fields = self.model_dump(exclude_unset=True, exclude={"profile_id"})
         
-        if self.language is not None:
-            update_data["language"] = self.language
-        
-        if self.theme is not None:
-            update_data["theme"] = self.theme
-        
-        if self.notification_enabled is not None:
-            update_data["notification_enabled"] = self.notification_enabled
+        update_data = {
+            field: value
+            for field, value in set_fields.items()
+            if value is not None and field not in _CLEAR_FLAG_FIELDS
+        }
         
         # Handle clear flags (set fields to None)
-        if self.clear_bio:
-            update_data["bio"] = None
-        
-        if self.clear_location:
-            update_data["location"] = None
-        
-        if self.clear_timezone:
-            update_data["timezone"] = None
-        
-        if self.clear_profile_photo:
-            update_data["profile_photo"] = None
+        for flag, field in _CLEAR_FLAG_FIELDS.items():
+            if set_fields.get(flag):
+                update_data[field] = None
         
         # Always update the updated_at timestamp
         update_data["updated_at"] = datetime.utcnow()
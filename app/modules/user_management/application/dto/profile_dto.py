@@ -524,8 +524,10 @@ class ProfileResponseDTO(BaseModel):
         # Preferences (self/admin only)
         if privacy_level in ["self", "admin"]:
             response_data.update({
-                "language": LanguageCode(profile.language),
-                "theme": ThemePreference(profile.theme),
+                # Raw strings: field validation maps them onto the enums and
+                # use_enum_values stores the plain value, so no Enum() call here
+                "language": profile.language,
+                "theme": profile.theme,
                 "notification_enabled": profile.notification_enabled,
             })
         
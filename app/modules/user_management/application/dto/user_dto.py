@@ -143,10 +143,6 @@ class UserDTO(BaseModel):
         """Pydantic configuration."""
         # Use enum values in schema
         use_enum_values = True
-        # Allow JSON serialization of datetime
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
         # Example for API documentation
         schema_extra = {
             "example": {
@@ -350,9 +346,6 @@ class UserResponseDTO(BaseModel):
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
         schema_extra = {
             "example": {
                 "user_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -534,9 +527,6 @@ class UserSecurityDTO(BaseModel):
     
     class Config:
         """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
         schema_extra = {
             "example": {
                 "user_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -12,7 +12,8 @@
 # - app.modules.user_management.domain.services (domain business logic)
 # - app.modules.user_management.domain.repositories (repository interfaces)
 # - app.modules.user_management.infrastructure.database (repository implementations)
-# - passlib for password hashing (security standard)
+# - app.modules.user_management.infrastructure.cache for profile response invalidation
+# - app.shared.core.security for bcrypt password hashing (security standard)
 #
 # 🔄 Connected Modules / Calls From:
 # - app.modules.user_management.presentation.api.v1 (API endpoints invoke handlers)
@@ -40,12 +41,10 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict
 from fastapi import Depends
+import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.shared.infrastructure.database.session import get_db_session  # or however you access DB session
 
-# --- Third-party ---
-from passlib.context import CryptContext
-
 # --- Application commands ---
 from app.modules.user_management.application.commands.create_user import CreateUserCommand
 from app.modules.user_management.application.commands.update_profile import UpdateProfileCommand
@@ -66,12 +65,14 @@ from app.modules.user_management.domain.repositories.profile_repository import P
 
 # --- Infrastructure / External services ---
 from app.modules.user_management.infrastructure.external.supabase_auth import SupabaseAuthService
+from app.modules.user_management.infrastructure.cache.profile_cache import invalidate_profile_response
 from app.shared.events.publisher import EventPublisher
+from app.shared.core.dependencies import get_redis
+from app.shared.core.security import get_password_hash_async, verify_password_async
 
 from app.modules.user_management.infrastructure.database.user_repository_impl import UserRepositoryImpl
 
 logger = logging.getLogger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def get_user_repository(
     session: AsyncSession = Depends(get_db_session),
@@ -110,7 +111,7 @@ class CreateUserCommandHandler:
             if existing_user:
                 raise ValueError(f"User with email {command.email} already exists")
 
-            password_hash = pwd_context.hash(command.password)
+            password_hash = await get_password_hash_async(command.password)
             user_data, profile_data = command.to_domain_entities()
             user_data["password_hash"] = password_hash
             user = User(**user_data)
@@ -210,10 +211,12 @@ class UpdateProfileCommandHandler:
         profile_service: ProfileService = Depends(),
         profile_repository: ProfileRepository = Depends(),
         event_publisher: EventPublisher = Depends(),
+        redis_client: redis.Redis = Depends(get_redis),
     ):
         self._profile_service = profile_service
         self._profile_repository = profile_repository
         self._event_publisher = event_publisher
+        self._redis = redis_client
 
     async def handle(self, command: UpdateProfileCommand) -> Dict:
         """
@@ -240,6 +243,7 @@ class UpdateProfileCommandHandler:
                 raise ValueError(f"Profile update validation failed: {validation_result.error_message}")
 
             saved_profile = await self._profile_repository.update(updated_profile)
+            await invalidate_profile_response(self._redis, saved_profile.profile_id)
 
             await self._event_publisher.publish("ProfileUpdated", {
                 "profile_id": str(saved_profile.profile_id),
@@ -284,6 +288,7 @@ class DeleteUserCommandHandler:
         profile_repository: ProfileRepository = Depends(),
         supabase_auth: SupabaseAuthService = Depends(),
         event_publisher: EventPublisher = Depends(),
+        redis_client: redis.Redis = Depends(get_redis),
     ):
         self._user_service = user_service
         self._auth_service = auth_service
@@ -292,6 +297,7 @@ class DeleteUserCommandHandler:
         self._profile_repository = profile_repository
         self._supabase_auth = supabase_auth
         self._event_publisher = event_publisher
+        self._redis = redis_client
 
     async def handle(self, command: DeleteUserCommand) -> Dict:
         """
@@ -304,7 +310,7 @@ class DeleteUserCommandHandler:
                 raise ValueError(f"User not found: {command.user_id}")
 
             if command.requires_password_verification():
-                password_valid = pwd_context.verify(
+                password_valid = await verify_password_async(
                     command.password_confirmation,
                     existing_user.password_hash
                 )
@@ -324,7 +330,10 @@ class DeleteUserCommandHandler:
             cleanup_ops = command.get_cleanup_operations()
 
             if cleanup_ops["delete_user_data"]:
+                profile = await self._profile_repository.get_by_user_id(command.user_id)
                 profile_deleted = await self._profile_repository.delete_by_user_id(command.user_id)
+                if profile is not None:
+                    await invalidate_profile_response(self._redis, profile.profile_id)
                 if profile_deleted:
                     await self._event_publisher.publish("ProfileDeleted", {
                         "user_id": str(command.user_id),
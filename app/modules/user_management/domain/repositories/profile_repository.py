@@ -9,7 +9,7 @@
 # Domain services, infrastructure implementations, application handlers, community features
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from ..models.profile import Profile, ProfileVisibility
 
@@ -318,6 +318,42 @@ class ProfileRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def count_public_profiles(self, location: Optional[str] = None) -> int:
+        """
+        Count public profiles, optionally filtered by location.
+        
+        Args:
+            location: Optional location substring filter
+            
+        Returns:
+            Number of matching public profiles
+        """
+        pass
+    
+    @abstractmethod
+    def stream_public_profiles(
+        self,
+        location: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream public profile fields row by row for discovery listings.
+        
+        Rows are yielded as they arrive from the database cursor instead of
+        being materialized into domain entities first.
+        
+        Args:
+            location: Optional location substring filter
+            limit: Maximum number of profiles to yield
+            offset: Number of profiles to skip
+            
+        Returns:
+            Async iterator of public profile field mappings
+        """
+        pass
+    
     @abstractmethod
     async def get_profiles_without_photos(
         self,
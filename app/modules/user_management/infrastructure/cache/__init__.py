@@ -0,0 +1,43 @@
+# 📄 File: app/modules/user_management/infrastructure/cache/__init__.py
+# 🧭 Purpose (Layman Explanation):
+# This file organizes the short-lived caches for user management, like the saved copies of
+# profile pages that let us answer repeat views without asking the database again.
+#
+# 🧪 Purpose (Technical Summary):
+# Cache layer organization for user management, exposing the Redis-backed profile response
+# cache shared by the profile routes (reads) and the command handlers (invalidation).
+#
+# 🔗 Dependencies:
+# - redis.asyncio client
+# - app.shared.config.redis (cache key patterns and TTLs)
+#
+# 🔄 Connected Modules / Calls From:
+# - app.modules.user_management.application.handlers.command_handlers (invalidation)
+# - app.modules.user_management.presentation.api.v1.profiles (reads, writes, invalidation)
+
+"""
+User Management Cache Layer
+
+Redis-backed caches for user management read paths.
+
+Cache Components:
+- Profile responses: Serialized profile responses per privacy level
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.modules.user_management.infrastructure.cache.profile_cache import (
+        PROFILE_CACHE_LEVELS,
+        cache_profile_response,
+        get_cached_profile_response,
+        invalidate_profile_response,
+    )
+
+
+__all__ = [
+    "PROFILE_CACHE_LEVELS",
+    "cache_profile_response",
+    "get_cached_profile_response",
+    "invalidate_profile_response",
+]
@@ -0,0 +1,91 @@
+# 📄 File: app/modules/user_management/infrastructure/cache/profile_cache.py
+# 🧭 Purpose (Layman Explanation):
+# Keeps a short-lived saved copy of each profile as it was shown to viewers, and throws the
+# copy away whenever the profile changes or is deleted so nobody sees old information.
+#
+# 🧪 Purpose (Technical Summary):
+# Redis-backed cache of serialized profile responses keyed by profile id and privacy level,
+# with best-effort reads, writes, and invalidation that never fail the calling request.
+#
+# 🔗 Dependencies:
+# - redis.asyncio client
+# - app.shared.config.redis.cache_config (key pattern and TTL for "profile_response")
+#
+# 🔄 Connected Modules / Calls From:
+# - app.modules.user_management.application.handlers.command_handlers
+# - app.modules.user_management.presentation.api.v1.profiles
+
+"""
+Profile Response Cache
+
+Each cached entry is a Redis hash holding the profile ``owner`` user id and
+the serialized JSON ``body`` for one privacy level. Write paths that change
+or delete a profile drop every privacy level at once.
+"""
+
+import logging
+from typing import Dict, Optional
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from app.shared.config.redis import cache_config
+
+logger = logging.getLogger(__name__)
+
+# Privacy levels a cached profile response can be stored under
+PROFILE_CACHE_LEVELS = ("public", "self", "admin")
+
+
+def _profile_cache_key(profile_id: UUID, privacy_level: str) -> str:
+    """Build the Redis key for a serialized profile response."""
+    return cache_config.get_cache_key(
+        "profile_response", profile_id=profile_id, privacy_level=privacy_level
+    )
+
+
+async def get_cached_profile_response(
+    redis_client: redis.Redis,
+    profile_id: UUID,
+    privacy_level: str,
+) -> Optional[Dict[str, str]]:
+    """
+    Fetch a cached profile response.
+    
+    Returns:
+        Optional[Dict[str, str]]: ``owner`` user id and JSON ``body``, or None on miss
+    """
+    try:
+        cached = await redis_client.hgetall(_profile_cache_key(profile_id, privacy_level))
+    except Exception as e:
+        logger.warning("Profile cache read failed for %s: %s", profile_id, e)
+        return None
+    return cached or None
+
+
+async def cache_profile_response(
+    redis_client: redis.Redis,
+    profile_id: UUID,
+    privacy_level: str,
+    owner_id: str,
+    body: str,
+) -> None:
+    """Store a serialized profile response with the short profile TTL."""
+    key = _profile_cache_key(profile_id, privacy_level)
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping={"owner": owner_id, "body": body})
+            pipe.expire(key, cache_config.get_ttl("profile_response"))
+            await pipe.execute()
+    except Exception as e:
+        logger.warning("Profile cache write failed for %s: %s", profile_id, e)
+
+
+async def invalidate_profile_response(redis_client: redis.Redis, profile_id: UUID) -> None:
+    """Drop every cached privacy view of a profile after it changes or is deleted."""
+    try:
+        await redis_client.delete(
+            *(_profile_cache_key(profile_id, level) for level in PROFILE_CACHE_LEVELS)
+        )
+    except Exception as e:
+        logger.warning("Profile cache invalidation failed for %s: %s", profile_id, e)
@@ -46,7 +46,7 @@ from sqlalchemy import func, and_, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from datetime import timedelta,date,datetime,time,timezone
-from typing import Dict, Any, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from app.modules.user_management.domain.repositories.profile_repository import ProfileRepository
 from app.modules.user_management.domain.models.profile import Profile
@@ -338,6 +338,79 @@ class ProfileRepositoryImpl(ProfileRepository):
             logger.error(f"Database error searching profiles by name {name_pattern}: {str(e)}")
             raise Exception(f"Failed to search profiles by name: {str(e)}") from e
     
+    def _public_profiles_filter(self, location: Optional[str]):
+        """Build the WHERE clause shared by public profile listing queries."""
+        conditions = [ProfileModel.visibility == "public"]
+        if location:
+            conditions.append(ProfileModel.location.ilike(f"%{location}%"))
+        return and_(*conditions)
+    
+    async def count_public_profiles(self, location: Optional[str] = None) -> int:
+        """
+        Count public profiles, optionally filtered by location.
+        
+        Args:
+            location: Optional location substring filter
+            
+        Returns:
+            int: Number of matching public profiles
+        """
+        try:
+            stmt = (
+                select(func.count(ProfileModel.profile_id))
+                .where(self._public_profiles_filter(location))
+            )
+            result = await self._session.execute(stmt)
+            return result.scalar() or 0
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Database error counting public profiles: {str(e)}")
+            raise RepositoryError(f"Failed to count public profiles: {e}") from e
+    
+    async def stream_public_profiles(
+        self,
+        location: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream public profile fields using a server-side cursor.
+        
+        Only the publicly visible columns are selected, and rows are yielded
+        as plain mappings without building domain entities.
+        
+        Args:
+            location: Optional location substring filter
+            limit: Maximum number of profiles to yield
+            offset: Number of profiles to skip
+            
+        Yields:
+            Dict[str, Any]: Public profile fields for one profile
+        """
+        stmt = (
+            select(
+                ProfileModel.profile_id,
+                ProfileModel.user_id,
+                ProfileModel.display_name,
+                ProfileModel.profile_photo,
+                ProfileModel.bio,
+                ProfileModel.location,
+                ProfileModel.timezone,
+            )
+            .where(self._public_profiles_filter(location))
+            .order_by(ProfileModel.updated_at.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        try:
+            result = await self._session.stream(stmt)
+            async for row in result.mappings():
+                yield dict(row)
+                
+        except SQLAlchemyError as e:
+            logger.error(f"Database error streaming public profiles: {str(e)}")
+            raise RepositoryError(f"Failed to stream public profiles: {e}") from e
+    
     async def _user_exists(self, user_id: UUID) -> bool:
         """
         Check if a user exists in the database.
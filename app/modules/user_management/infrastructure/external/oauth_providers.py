@@ -37,10 +37,15 @@ Features:
 - Provider-specific error handling
 """
 
+import asyncio
 import logging
+import secrets
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Tuple
-from urllib.parse import urlencode
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Deque, Dict, Mapping, Optional, Tuple, Type
+from urllib.parse import quote_plus, urlencode
 import json
 
 import httpx
@@ -49,6 +54,70 @@ from app.shared.config.settings import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Pre-generated CSRF state values for OAuth initiation
+OAUTH_STATE_POOL_SIZE = 1024
+OAUTH_STATE_REFILL_THRESHOLD = 256
+OAUTH_STATE_BYTES = 16
+
+_state_pool: Deque[str] = deque(maxlen=OAUTH_STATE_POOL_SIZE)
+_state_refill_task: Optional[asyncio.Task] = None
+
+
+def fill_oauth_state_pool() -> None:
+    """
+    Top up the OAuth state pool to its full size.
+    
+    Called once at application startup and from a worker thread whenever
+    the pool runs low, so CSPRNG reads stay off the request path.
+    """
+    missing = OAUTH_STATE_POOL_SIZE - len(_state_pool)
+    _state_pool.extend(secrets.token_urlsafe(OAUTH_STATE_BYTES) for _ in range(missing))
+
+
+def _schedule_state_pool_refill() -> None:
+    """Start a background refill unless one is already running."""
+    global _state_refill_task
+    
+    if _state_refill_task is not None and not _state_refill_task.done():
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _state_refill_task = loop.create_task(asyncio.to_thread(fill_oauth_state_pool))
+
+
+def next_oauth_state() -> str:
+    """
+    Take a single-use CSRF state value for an OAuth authorization request.
+    
+    Returns:
+        str: URL-safe random state, generated live if the pool is empty
+    """
+    try:
+        state = _state_pool.popleft()
+    except IndexError:
+        state = secrets.token_urlsafe(OAUTH_STATE_BYTES)
+    
+    if len(_state_pool) < OAUTH_STATE_REFILL_THRESHOLD:
+        _schedule_state_pool_refill()
+    return state
+
+
+@lru_cache(maxsize=None)
+def _authorization_url_prefix(auth_url: str, static_params: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Build the static part of an authorization URL once per provider config.
+    
+    Args:
+        auth_url: Provider authorization endpoint
+        static_params: Query parameters that do not change between requests
+        
+    Returns:
+        str: URL ending in ``state=`` so callers only append the state value
+    """
+    return f"{auth_url}?{urlencode(static_params)}&state="
+
 
 class OAuthProvider(ABC):
     """Abstract base class for OAuth providers."""
@@ -106,17 +175,16 @@ class GoogleOAuthProvider(OAuthProvider):
         Returns:
             str: Authorization URL for Google OAuth
         """
-        params = {
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "scope": " ".join(self.scopes),
-            "response_type": "code",
-            "state": state,
-            "access_type": "offline",  # Request refresh token
-            "prompt": "consent",  # Force consent screen for refresh token
-        }
+        static_params = (
+            ("client_id", self.client_id),
+            ("redirect_uri", self.redirect_uri),
+            ("scope", " ".join(self.scopes)),
+            ("response_type", "code"),
+            ("access_type", "offline"),  # Request refresh token
+            ("prompt", "consent"),  # Force consent screen for refresh token
+        )
         
-        auth_url = f"{self.auth_url}?{urlencode(params)}"
+        auth_url = _authorization_url_prefix(self.auth_url, static_params) + quote_plus(state)
         logger.debug("Generated Google OAuth authorization URL")
         return auth_url
     
@@ -238,16 +306,15 @@ class AppleOAuthProvider(OAuthProvider):
         Returns:
             str: Authorization URL for Apple Sign-In
         """
-        params = {
-            "client_id": self.client_id,
-            "redirect_uri": self.redirect_uri,
-            "response_type": "code",
-            "scope": " ".join(self.scopes),
-            "state": state,
-            "response_mode": "form_post",  # Apple requirement
-        }
+        static_params = (
+            ("client_id", self.client_id),
+            ("redirect_uri", self.redirect_uri),
+            ("response_type", "code"),
+            ("scope", " ".join(self.scopes)),
+            ("response_mode", "form_post"),  # Apple requirement
+        )
         
-        auth_url = f"{self.auth_url}?{urlencode(params)}"
+        auth_url = _authorization_url_prefix(self.auth_url, static_params) + quote_plus(state)
         logger.debug("Generated Apple OAuth authorization URL")
         return auth_url
     
@@ -352,6 +419,21 @@ class AppleOAuthProvider(OAuthProvider):
         return "apple_client_secret_jwt"
 
 
+# Provider implementations by name; adding a provider only needs an entry here
+OAUTH_PROVIDER_CLASSES: Dict[str, Type[OAuthProvider]] = {
+    "google": GoogleOAuthProvider,
+    "apple": AppleOAuthProvider,
+}
+
+SUPPORTED_OAUTH_PROVIDERS = frozenset(OAUTH_PROVIDER_CLASSES)
+
+
+@lru_cache(maxsize=1)
+def _get_oauth_providers() -> Mapping[str, OAuthProvider]:
+    """Instantiate each registered provider once and share it read-only."""
+    return MappingProxyType({name: cls() for name, cls in OAUTH_PROVIDER_CLASSES.items()})
+
+
 class OAuthProviderManager:
     """
     Manager class for handling multiple OAuth providers.
@@ -362,10 +444,8 @@ class OAuthProviderManager:
     
     def __init__(self):
         """Initialize OAuth provider manager."""
-        self.providers = {
-            "google": GoogleOAuthProvider(),
-            "apple": AppleOAuthProvider(),
-        }
+        # Providers only hold static configuration, so all managers share them
+        self.providers = _get_oauth_providers()
     
     def get_provider(self, provider_name: str) -> Optional[OAuthProvider]:
         """
@@ -377,7 +457,10 @@ class OAuthProviderManager:
         Returns:
             Optional[OAuthProvider]: Provider instance if found, None otherwise
         """
-        provider = self.providers.get(provider_name.lower())
+        # Validated provider values are already lowercase, so try the exact key first
+        provider = self.providers.get(provider_name)
+        if provider is None:
+            provider = self.providers.get(provider_name.lower())
         if not provider:
             logger.warning(f"Unknown OAuth provider: {provider_name}")
         return provider
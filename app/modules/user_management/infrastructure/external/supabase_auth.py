@@ -29,6 +29,7 @@ The service integrates with Supabase Auth to provide secure, scalable authentica
 for the Plant Care application while maintaining compatibility with the domain architecture.
 """
 
+import asyncio
 import logging
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
@@ -130,8 +131,8 @@ class SupabaseAuthService:
             Session data if valid, None if invalid
         """
         try:
-            # Use Supabase client to verify the token
-            response = self.client.auth.get_user(token)
+            # The Supabase client is synchronous, so keep its HTTP call off the event loop
+            response = await asyncio.to_thread(self.client.auth.get_user, token)
             
             if response and response.user:
                 return {
@@ -189,7 +190,7 @@ class SupabaseAuthService:
             New token information if successful, None otherwise
         """
         try:
-            response = self.client.auth.refresh_session(refresh_token)
+            response = await asyncio.to_thread(self.client.auth.refresh_session, refresh_token)
             
             if response and response.session:
                 return {
@@ -225,7 +226,7 @@ class SupabaseAuthService:
             True if successful, False otherwise
         """
         try:
-            self.client.auth.sign_out()
+            await asyncio.to_thread(self.client.auth.sign_out)
             logger.info("User signed out successfully")
             return True
             
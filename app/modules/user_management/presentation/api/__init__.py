@@ -72,6 +72,7 @@ def create_user_management_router() -> "APIRouter":
         APIRouter: Combined router for all user management endpoints
     """
     from fastapi import APIRouter
+    from fastapi.responses import ORJSONResponse
     from app.modules.user_management.presentation.api.v1.auth import auth_router
     from app.modules.user_management.presentation.api.v1.users import users_router
     from app.modules.user_management.presentation.api.v1.profiles import profiles_router
@@ -80,6 +81,7 @@ def create_user_management_router() -> "APIRouter":
     main_router = APIRouter(
         prefix="/api/v1",
         tags=["User Management"],
+        default_response_class=ORJSONResponse,
         responses={
             400: {"description": "Bad Request - Invalid input data"},
             401: {"description": "Unauthorized - Authentication required"},
@@ -64,7 +64,10 @@ if TYPE_CHECKING:
     # User Schemas
     from app.modules.user_management.presentation.api.schemas.user_schemas import (
         UserResponse,
+        SelfUserResponse,
+        AdminUserResponse,
         UserListResponse,
+        CompactUserResponse,
         UserUpdateRequest,
         UserSecurityResponse,
         UserDeleteRequest,
@@ -105,7 +108,10 @@ __all__ = [
     
     # User Schemas
     "UserResponse",
+    "SelfUserResponse",
+    "AdminUserResponse",
     "UserListResponse",
+    "CompactUserResponse",
     "UserUpdateRequest",
     "UserSecurityResponse",
     "UserDeleteRequest",
@@ -147,7 +153,8 @@ def get_schema_info() -> dict:
         "user_schemas": {
             "description": "Schemas for user account management and administration",
             "schemas": [
-                "UserResponse", "UserListResponse", "UserUpdateRequest", "UserSecurityResponse",
+                "UserResponse", "SelfUserResponse", "AdminUserResponse", "UserListResponse",
+                "CompactUserResponse", "UserUpdateRequest", "UserSecurityResponse",
                 "UserDeleteRequest", "UserDeleteResponse", "EmailVerificationResponse",
                 "AccountUnlockResponse"
             ]
@@ -0,0 +1,64 @@
+# 📄 File: app/modules/user_management/presentation/api/schemas/_schema_base.py
+# 🧭 Purpose (Layman Explanation):
+# This file holds small building blocks shared by several schema files, like the
+# email type that tidies up addresses before they are saved or compared, and the
+# loader for the example payloads shown in the API docs.
+#
+# 🧪 Purpose (Technical Summary):
+# Shared annotated field types and the lazy OpenAPI example loader for the user
+# management API schemas, kept in one lightweight module so schema files reuse
+# them without importing each other.
+#
+# 🔗 Dependencies:
+# - pydantic for annotated field types (EmailStr, AfterValidator)
+# - orjson for reading the JSON example sidecars
+#
+# 🔄 Connected Modules / Calls From:
+# - app.modules.user_management.presentation.api.schemas.auth_schemas
+# - app.modules.user_management.presentation.api.schemas.user_schemas
+
+"""
+Shared Schema Types
+
+Field types and example loading reused across the authentication and user
+schema modules. This module only depends on pydantic and orjson, so importing
+it does not pull in the auth module's request decoders.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated, Callable, Dict
+
+import orjson
+from pydantic import AfterValidator, EmailStr
+
+
+# Pre-bound str methods used by the email normalizer
+_lower: Callable[[str], str] = str.lower
+_strip: Callable[[str], str] = str.strip
+
+
+def _normalize_email(v: str) -> str:
+    """Normalize email addresses to trimmed lowercase."""
+    return _lower(_strip(v))
+
+
+# Shared email type so normalization compiles into a single schema node
+NormalizedEmail = Annotated[EmailStr, AfterValidator(_normalize_email)]
+
+
+# Directory holding the JSON example sidecars for the schema modules
+_SCHEMAS_DIR = Path(__file__).parent
+
+
+@lru_cache(maxsize=None)
+def load_examples(filename: str) -> Dict[str, dict]:
+    """Load the example payloads from a JSON sidecar next to the schemas."""
+    return orjson.loads((_SCHEMAS_DIR / filename).read_bytes())
+
+
+def lazy_example(filename: str, name: str) -> Callable[[dict], None]:
+    """Build a json_schema_extra hook that adds the named example from a sidecar."""
+    def add_example(schema: dict) -> None:
+        schema["example"] = load_examples(filename)[name]
+    return add_example
@@ -49,12 +49,21 @@ All schemas follow Core Doc 1.2 specifications and implement proper
 privacy measures for social features and profile management.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
-from uuid import UUID
+from types import MappingProxyType
+from typing import Annotated, Any, Callable, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, computed_field
 
-from pydantic import BaseModel, Field, validator
+from app.modules.user_management.presentation.api.schemas._schema_base import lazy_example
+from app.shared.config.settings import get_settings
+
+# Domain-sourced responses are trusted and built without re-validation;
+# debug builds keep full validation to surface mapping mistakes early.
+_VALIDATE_DOMAIN_RESPONSES = get_settings().DEBUG
 
 
 class ThemePreference(str, Enum):
@@ -95,6 +104,35 @@ class ProfileSortField(str, Enum):
     LOCATION = "location"
 
 
+class SortOrder(str, Enum):
+    """Sort direction enumeration."""
+    ASC = "asc"
+    DESC = "desc"
+
+
+# Literal counterparts of the enums above, used by schema fields so values
+# are validated and stored as plain strings without constructing Enum members.
+ThemeValue = Literal["light", "dark", "auto"]
+LanguageValue = Literal["auto", "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko"]
+VisibilityValue = Literal["public", "friends", "private"]
+ProfileSortValue = Literal["created_at", "updated_at", "display_name", "completeness", "location"]
+
+
+# =============================================================================
+# SCHEMA EXAMPLES
+# =============================================================================
+
+# OpenAPI examples live in profile_schema_examples.json and are only read when
+# a JSON schema is generated, so request handling never loads them.
+
+_EXAMPLES_FILE = "profile_schema_examples.json"
+
+
+def _lazy_example(name: str) -> Callable[[dict], None]:
+    """Build a json_schema_extra hook that adds the named example."""
+    return lazy_example(_EXAMPLES_FILE, name)
+
+
 # =============================================================================
 # REQUEST SCHEMAS
 # =============================================================================
@@ -112,63 +150,45 @@ class ProfileCreateRequest(BaseModel):
         min_length=1,
         max_length=100,
         description="User's display name",
-        example="Jane Smith"
+        examples=["Jane Smith"]
     )
     bio: Optional[str] = Field(
         default=None,
         max_length=500,
         description="User biography (max 500 chars)",
-        example="Urban gardening enthusiast specializing in herbs and succulents"
+        examples=["Urban gardening enthusiast specializing in herbs and succulents"]
     )
     location: Optional[str] = Field(
         default=None,
         max_length=255,
         description="User's location for weather data",
-        example="Seattle, WA"
+        examples=["Seattle, WA"]
     )
     timezone: Optional[str] = Field(
         default="UTC",
         max_length=50,
         description="User's timezone",
-        example="America/Los_Angeles"
+        examples=["America/Los_Angeles"]
     )
-    language: LanguageCode = Field(
-        default=LanguageCode.AUTO,
+    language: LanguageValue = Field(
+        default="auto",
         description="Preferred language",
-        example=LanguageCode.EN
+        examples=["en"]
     )
-    theme: ThemePreference = Field(
-        default=ThemePreference.AUTO,
+    theme: ThemeValue = Field(
+        default="auto",
         description="UI theme preference",
-        example=ThemePreference.LIGHT
+        examples=["light"]
     )
     notification_enabled: bool = Field(
         default=True,
         description="Global notification toggle",
-        example=True
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        schema_extra = {
-            "example": {
-                "display_name": "Jane Smith",
-                "bio": "Urban gardening enthusiast specializing in herbs and succulents",
-                "location": "Seattle, WA",
-                "timezone": "America/Los_Angeles",
-                "language": "en",
-                "theme": "light",
-                "notification_enabled": True
-            }
-        }
-    
-    @validator('bio')
-    def validate_bio_length(cls, v):
-        """Validate bio length according to Core Doc 1.2 (max 500 chars)."""
-        if v is not None and len(v) > 500:
-            raise ValueError("Bio must not exceed 500 characters")
-        return v
+        examples=[True]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfileCreateRequest"),
+    )
 
 
 class ProfileUpdateRequest(BaseModel):
@@ -184,94 +204,73 @@ class ProfileUpdateRequest(BaseModel):
         min_length=1,
         max_length=100,
         description="Updated display name",
-        example="Jane Green"
+        examples=["Jane Green"]
     )
     profile_photo: Optional[str] = Field(
         default=None,
         max_length=500,
         description="Updated profile photo URL",
-        example="https://supabase.co/storage/v1/object/profiles/user456/new_avatar.jpg"
+        examples=["https://supabase.co/storage/v1/object/profiles/user456/new_avatar.jpg"]
     )
     bio: Optional[str] = Field(
         default=None,
         max_length=500,
         description="Updated biography",
-        example="Experienced urban gardener with focus on sustainable practices"
+        examples=["Experienced urban gardener with focus on sustainable practices"]
     )
     location: Optional[str] = Field(
         default=None,
         max_length=255,
         description="Updated location",
-        example="Portland, OR"
+        examples=["Portland, OR"]
     )
     timezone: Optional[str] = Field(
         default="UTC",
         max_length=50,
         description="Updated timezone",
-        example="America/Los_Angeles"
+        examples=["America/Los_Angeles"]
     )
-    language: Optional[LanguageCode] = Field(
+    language: Optional[LanguageValue] = Field(
         default=None,
         description="Updated language preference",
-        example=LanguageCode.ES
+        examples=["es"]
     )
-    theme: Optional[ThemePreference] = Field(
+    theme: Optional[ThemeValue] = Field(
         default=None,
         description="Updated theme preference",
-        example=ThemePreference.DARK
+        examples=["dark"]
     )
     notification_enabled: Optional[bool] = Field(
         default=None,
         description="Updated notification setting",
-        example=False
+        examples=[False]
     )
     
     # Clear flags for nullable fields (Core Doc 1.2)
     clear_bio: bool = Field(
         default=False,
         description="Set to true to clear bio field",
-        example=False
+        examples=[False]
     )
     clear_location: bool = Field(
         default=False,
         description="Set to true to clear location field",
-        example=False
+        examples=[False]
     )
     clear_timezone: bool = Field(
         default=False,
         description="Set to true to clear timezone field",
-        example=False
+        examples=[False]
     )
     clear_profile_photo: bool = Field(
         default=False,
         description="Set to true to clear profile photo",
-        example=False
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        schema_extra = {
-            "example": {
-                "display_name": "Jane Green",
-                "bio": "Experienced urban gardener with focus on sustainable practices",
-                "location": "Portland, OR",
-                "language": "es",
-                "theme": "dark",
-                "notification_enabled": False,
-                "clear_bio": False,
-                "clear_location": False,
-                "clear_timezone": False,
-                "clear_profile_photo": False
-            }
-        }
-    
-    @validator('bio')
-    def validate_bio_length(cls, v):
-        """Validate bio length according to Core Doc 1.2 (max 500 chars)."""
-        if v is not None and len(v) > 500:
-            raise ValueError("Bio must not exceed 500 characters")
-        return v
+        examples=[False]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfileUpdateRequest"),
+    )
 
 
 class ProfilePrivacyRequest(BaseModel):
@@ -282,50 +281,40 @@ class ProfilePrivacyRequest(BaseModel):
     control over profile data visibility and social features.
     """
     
-    profile_visibility: VisibilityLevel = Field(
-        default=VisibilityLevel.PUBLIC,
+    profile_visibility: VisibilityValue = Field(
+        default="public",
         description="Overall profile visibility",
-        example=VisibilityLevel.PUBLIC
+        examples=["public"]
     )
-    bio_visibility: VisibilityLevel = Field(
-        default=VisibilityLevel.PUBLIC,
+    bio_visibility: VisibilityValue = Field(
+        default="public",
         description="Bio visibility level",
-        example=VisibilityLevel.PUBLIC
+        examples=["public"]
     )
-    location_visibility: VisibilityLevel = Field(
-        default=VisibilityLevel.PUBLIC,
+    location_visibility: VisibilityValue = Field(
+        default="public",
         description="Location visibility level",
-        example=VisibilityLevel.FRIENDS
+        examples=["friends"]
     )
     allow_friend_requests: bool = Field(
         default=True,
         description="Allow friend requests",
-        example=True
+        examples=[True]
     )
     show_in_search: bool = Field(
         default=True,
         description="Show profile in search results",
-        example=True
+        examples=[True]
     )
     allow_direct_messages: bool = Field(
         default=True,
         description="Allow direct messages",
-        example=False
+        examples=[False]
     )
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        schema_extra = {
-            "example": {
-                "profile_visibility": "public",
-                "bio_visibility": "public",
-                "location_visibility": "friends",
-                "allow_friend_requests": True,
-                "show_in_search": True,
-                "allow_direct_messages": False
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfilePrivacyRequest"),
+    )
 
 
 class ProfileSearchRequest(BaseModel):
@@ -341,25 +330,25 @@ class ProfileSearchRequest(BaseModel):
         default=None,
         max_length=255,
         description="Search term for display name or bio",
-        example="gardening"
+        examples=["gardening"]
     )
     location: Optional[str] = Field(
         default=None,
         max_length=255,
         description="Location filter",
-        example="Seattle"
+        examples=["Seattle"]
     )
     
     # Interest filters
     has_bio: Optional[bool] = Field(
         default=None,
         description="Filter profiles with/without bio",
-        example=True
+        examples=[True]
     )
     has_photo: Optional[bool] = Field(
         default=None,
         description="Filter profiles with/without photo",
-        example=True
+        examples=[True]
     )
     
     # Completeness filters
@@ -368,19 +357,19 @@ class ProfileSearchRequest(BaseModel):
         ge=0.0,
         le=100.0,
         description="Minimum profile completeness percentage",
-        example=50.0
+        examples=[50.0]
     )
     
     # Activity filters
     created_after: Optional[datetime] = Field(
         default=None,
         description="Filter profiles created after this date",
-        example="2024-01-01T00:00:00Z"
+        examples=["2024-01-01T00:00:00Z"]
     )
     updated_after: Optional[datetime] = Field(
         default=None,
         description="Filter profiles updated after this date",
-        example="2024-01-01T00:00:00Z"
+        examples=["2024-01-01T00:00:00Z"]
     )
     
     # Pagination
@@ -388,60 +377,105 @@ class ProfileSearchRequest(BaseModel):
         default=1,
         ge=1,
         description="Page number",
-        example=1
+        examples=[1]
     )
     page_size: int = Field(
         default=20,
         ge=1,
         le=50,
         description="Items per page (max 50 for profiles)",
-        example=20
+        examples=[20]
     )
     
     # Sorting
-    sort_by: ProfileSortField = Field(
-        default=ProfileSortField.UPDATED_AT,
+    sort_by: ProfileSortValue = Field(
+        default="updated_at",
         description="Sort field",
-        example=ProfileSortField.COMPLETENESS
+        examples=["completeness"]
     )
-    sort_order: str = Field(
-        default="desc",
+    sort_order: SortOrder = Field(
+        default=SortOrder.DESC,
         description="Sort order (asc, desc)",
-        example="desc"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "search_term": "gardening",
-                "location": "Seattle",
-                "has_bio": True,
-                "has_photo": True,
-                "min_completeness": 50.0,
-                "page": 1,
-                "page_size": 20,
-                "sort_by": "completeness",
-                "sort_order": "desc"
-            }
-        }
-    
-    @validator('sort_order')
-    def validate_sort_order(cls, v):
-        """Validate sort order options."""
-        if v not in ["asc", "desc"]:
-            raise ValueError("Sort order must be 'asc' or 'desc'")
-        return v
+        examples=[SortOrder.DESC]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfileSearchRequest"),
+    )
 
 
 # =============================================================================
 # RESPONSE SCHEMAS
 # =============================================================================
 
+# Completion level labels by minimum completeness percentage, highest first
+_COMPLETION_SCORE_BANDS = (
+    (90.0, "Excellent"),
+    (75.0, "Good"),
+    (50.0, "Fair"),
+    (25.0, "Basic"),
+    (0.0, "Incomplete"),
+)
+
+# Privacy projections: one specialised builder per privacy level, picked
+# once per request instead of re-testing the level for every field.
+
+def _project_public(profile_data: dict, settings: dict) -> dict:
+    """Fields visible to other users, subject to the owner's privacy settings."""
+    get = profile_data.get
+    response_data = {
+        "profile_id": str(profile_data["profile_id"]),
+        "user_id": str(profile_data["user_id"]),
+        "display_name": profile_data["display_name"],
+        "profile_photo": get("profile_photo"),
+    }
+    bio = get("bio")
+    if bio and settings.get("bio_visibility", "public") == "public":
+        response_data["bio"] = bio
+    if settings.get("location_visibility", "public") == "public":
+        response_data["location"] = get("location")
+        response_data["timezone"] = get("timezone")
+    return response_data
+
+
+def _project_admin(profile_data: dict, settings: dict) -> dict:
+    """All stored profile fields; privacy settings do not apply to admins."""
+    get = profile_data.get
+    return {
+        "profile_id": str(profile_data["profile_id"]),
+        "user_id": str(profile_data["user_id"]),
+        "display_name": profile_data["display_name"],
+        "profile_photo": get("profile_photo"),
+        "bio": get("bio"),
+        "location": get("location"),
+        "timezone": get("timezone"),
+        "language": get("language", "auto"),
+        "theme": get("theme", "auto"),
+        "notification_enabled": get("notification_enabled"),
+        "created_at": get("created_at"),
+        "updated_at": get("updated_at"),
+    }
+
+
+def _project_self(profile_data: dict, settings: dict) -> dict:
+    """Admin view plus the owner-only completeness percentage."""
+    response_data = _project_admin(profile_data, settings)
+    completeness = profile_data.get("profile_completeness")
+    if completeness is not None:
+        response_data["completeness_percentage"] = completeness["percentage"]
+    return response_data
+
+
+_PRIVACY_PROJECTIONS = MappingProxyType({
+    "public": _project_public,
+    "self": _project_self,
+    "admin": _project_admin,
+})
+
+# Shared read-only default for callers that pass no privacy settings
+_NO_PRIVACY_SETTINGS: MappingProxyType = MappingProxyType({})
+
+
 class ProfileResponse(BaseModel):
     """
     Profile response schema with privacy filtering.
@@ -450,105 +484,95 @@ class ProfileResponse(BaseModel):
     filtering based on requester permissions and user privacy settings.
     """
     
-    profile_id: UUID = Field(
+    profile_id: str = Field(
         ...,
         description="Profile identifier",
-        example="456e7890-f12a-34b5-c678-901234567890"
+        examples=["456e7890-f12a-34b5-c678-901234567890"]
     )
-    user_id: UUID = Field(
+    user_id: str = Field(
         ...,
         description="User identifier",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
     display_name: str = Field(
         ...,
         description="User's display name",
-        example="John Green"
+        examples=["John Green"]
     )
     profile_photo: Optional[str] = Field(
         default=None,
         description="Profile photo URL",
-        example="https://supabase.co/storage/v1/object/profiles/user123/avatar.jpg"
+        examples=["https://supabase.co/storage/v1/object/profiles/user123/avatar.jpg"]
     )
     bio: Optional[str] = Field(
         default=None,
         description="User biography (privacy controlled)",
-        example="Passionate indoor gardener"
+        examples=["Passionate indoor gardener"]
     )
     location: Optional[str] = Field(
         default=None,
         description="User location (privacy controlled)",
-        example="San Francisco, CA"
+        examples=["San Francisco, CA"]
     )
     timezone: Optional[str] = Field(
         default="UTC",
         description="User timezone (privacy controlled)",
-        example="America/Los_Angeles"
+        examples=["America/Los_Angeles"]
     )
-    language: Optional[LanguageCode] = Field(
+    language: Optional[LanguageValue] = Field(
         default=None,
         description="Language preference (self/admin only)",
-        example=LanguageCode.EN
+        examples=["en"]
     )
-    theme: Optional[ThemePreference] = Field(
+    theme: Optional[ThemeValue] = Field(
         default=None,
         description="Theme preference (self/admin only)",
-        example=ThemePreference.AUTO
+        examples=["auto"]
     )
     notification_enabled: Optional[bool] = Field(
         default=True,
         description="Notification setting (self/admin only)",
-        example=True
+        examples=[True]
     )
     created_at: Optional[datetime] = Field(
         default=None,
         description="Profile creation date",
-        example="2024-01-15T10:30:00Z"
+        examples=["2024-01-15T10:30:00Z"]
     )
     updated_at: Optional[datetime] = Field(
         default=None,
         description="Last update timestamp",
-        example="2024-01-20T15:45:00Z"
+        examples=["2024-01-20T15:45:00Z"]
     )
     
     # Computed fields (self only)
     completeness_percentage: Optional[float] = Field(
         default=None,
         description="Profile completeness percentage (self only)",
-        example=75.0
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "profile_id": "456e7890-f12a-34b5-c678-901234567890",
-                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                "display_name": "John Green",
-                "profile_photo": "https://supabase.co/storage/v1/object/profiles/user123/avatar.jpg",
-                "bio": "Passionate indoor gardener",
-                "location": "San Francisco, CA",
-                "timezone": "America/Los_Angeles",
-                "language": "en",
-                "theme": "auto",
-                "notification_enabled": True,
-                "created_at": "2024-01-15T10:30:00Z",
-                "updated_at": "2024-01-20T15:45:00Z",
-                "completeness_percentage": 75.0
-            }
-        }
+        examples=[75.0]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfileResponse"),
+    )
+    
+    def model_dump(self, **kwargs) -> dict:
+        """Dump without the None fields left behind by privacy filtering."""
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump(**kwargs)
+    
+    def model_dump_json(self, **kwargs) -> str:
+        """Serialize without the None fields left behind by privacy filtering."""
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
     
     @classmethod
     def from_domain_data(
         cls,
-        profile_data: Dict,
+        profile_data: dict,
         privacy_level: str = "public",
-        privacy_settings: Optional[Dict] = None
-    ) -> "ProfileResponse":
+        privacy_settings: Optional[dict] = None
+    ) -> ProfileResponse:
         """
         Create response from domain profile data with privacy filtering.
         
@@ -560,48 +584,16 @@ class ProfileResponse(BaseModel):
         Returns:
             ProfileResponse: Filtered profile response
         """
-        settings = privacy_settings or {}
-        # Base response data (always visible)
-        response_data = {
-            "profile_id": profile_data["profile_id"],
-            "user_id": profile_data["user_id"],
-            "display_name": profile_data["display_name"],
-            "profile_photo": profile_data.get("profile_photo"),
-        }
-        
-        # Bio visibility filtering
-        if profile_data.get("bio") and settings.get("bio_visibility", "public") == "public":
-            response_data["bio"] = profile_data["bio"]
-        elif privacy_level in ["self", "admin"]:
-            response_data["bio"] = profile_data.get("bio")
-        
-        # Location data filtering
-        location_visible = (
-            settings.get("location_visibility", "public") == "public" or
-            privacy_level in ["self", "admin"]
+        response_data = _PRIVACY_PROJECTIONS.get(privacy_level, _project_public)(
+            profile_data, privacy_settings or _NO_PRIVACY_SETTINGS
         )
-        if location_visible:
-            response_data["location"] = profile_data.get("location")
-            response_data["timezone"] = profile_data.get("timezone")
         
-        # Preferences (self/admin only)
-        if privacy_level in ["self", "admin"]:
-            response_data.update({
-                "language": LanguageCode(profile_data.get("language", "auto")),
-                "theme": ThemePreference(profile_data.get("theme", "auto")),
-                "notification_enabled": profile_data.get("notification_enabled"),
-                "created_at": profile_data.get("created_at"),
-                "updated_at": profile_data.get("updated_at"),
-            })
-        
-        # Completeness (self only)
-        if privacy_level == "self" and "profile_completeness" in profile_data:
-            response_data["completeness_percentage"] = profile_data["profile_completeness"]["percentage"]
-        
-        return cls(**response_data)
+        if _VALIDATE_DOMAIN_RESPONSES:
+            return cls(**response_data)
+        return cls.model_construct(**response_data)
     
     @classmethod
-    def from_handler_result(cls, handler_result: Dict, privacy_level: str = "self") -> "ProfileResponse":
+    def from_handler_result(cls, handler_result: dict, privacy_level: str = "self") -> ProfileResponse:
         """Create response from command handler result."""
         return cls.from_domain_data(handler_result, privacy_level=privacy_level)
 
@@ -614,68 +606,60 @@ class ProfileListResponse(BaseModel):
     discovery with navigation metadata and search information.
     """
     
-    profiles: List[ProfileResponse] = Field(
+    profiles: list[ProfileResponse] = Field(
         ...,
         description="List of profiles",
-        example=[]
+        examples=[[]]
     )
     total_count: int = Field(
         ...,
         ge=0,
         description="Total number of profiles matching criteria",
-        example=75
+        examples=[75]
     )
     page: int = Field(
         ...,
         ge=1,
         description="Current page number",
-        example=1
+        examples=[1]
     )
     page_size: int = Field(
         ...,
         ge=1,
         le=50,
         description="Number of profiles per page",
-        example=20
-    )
-    total_pages: int = Field(
-        ...,
-        ge=0,
-        description="Total number of pages",
-        example=4
-    )
-    has_next: bool = Field(
-        ...,
-        description="Whether there is a next page",
-        example=True
-    )
-    has_previous: bool = Field(
-        ...,
-        description="Whether there is a previous page",
-        example=False
+        examples=[20]
     )
     
     # Search summary
-    search_criteria: Dict = Field(
+    search_criteria: Annotated[dict[str, Any], SkipValidation] = Field(
         default_factory=dict,
         description="Summary of search criteria used",
-        example={"location": "Seattle", "min_completeness": 50.0}
+        examples=[{"location": "Seattle", "min_completeness": 50.0}]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfileListResponse"),
     )
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "profiles": [],
-                "total_count": 75,
-                "page": 1,
-                "page_size": 20,
-                "total_pages": 4,
-                "has_next": True,
-                "has_previous": False,
-                "search_criteria": {"location": "Seattle", "min_completeness": 50.0}
-            }
-        }
+    # Navigation metadata derived from the pagination fields
+    @computed_field
+    @property
+    def total_pages(self) -> int:
+        """Total number of pages"""
+        return (self.total_count + self.page_size - 1) // self.page_size
+    
+    @computed_field
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a next page"""
+        return self.page < self.total_pages
+    
+    @computed_field
+    @property
+    def has_previous(self) -> bool:
+        """Whether there is a previous page"""
+        return self.page > 1
 
 
 class ProfileCompletenessResponse(BaseModel):
@@ -686,65 +670,57 @@ class ProfileCompletenessResponse(BaseModel):
     analysis and improvement suggestions for better user engagement.
     """
     
-    profile_id: UUID = Field(
+    profile_id: str = Field(
         ...,
         description="Profile identifier",
-        example="456e7890-f12a-34b5-c678-901234567890"
+        examples=["456e7890-f12a-34b5-c678-901234567890"]
     )
     completeness_percentage: float = Field(
         ...,
         ge=0.0,
         le=100.0,
         description="Profile completeness percentage",
-        example=75.0
+        examples=[75.0]
     )
     completed_fields: int = Field(
         ...,
         ge=0,
         description="Number of completed fields",
-        example=6
+        examples=[6]
     )
     total_fields: int = Field(
         ...,
         ge=0,
         description="Total number of fields",
-        example=8
+        examples=[8]
     )
-    missing_fields: List[str] = Field(
+    missing_fields: list[str] = Field(
         ...,
         description="List of missing field names",
-        example=["bio", "location"]
+        examples=[["bio", "location"]]
     )
-    suggestions: List[str] = Field(
+    suggestions: list[str] = Field(
         default_factory=list,
         description="Improvement suggestions",
-        example=[
+        examples=[[
             "Add a bio to tell others about your gardening interests",
             "Set your location to get personalized weather data"
-        ]
+        ]]
     )
-    completion_score: str = Field(
-        ...,
-        description="Completion level description",
-        example="Good"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "profile_id": "456e7890-f12a-34b5-c678-901234567890",
-                "completeness_percentage": 75.0,
-                "completed_fields": 6,
-                "total_fields": 8,
-                "missing_fields": ["bio", "location"],
-                "suggestions": [
-                    "Add a bio to tell others about your gardening interests",
-                    "Set your location to get personalized weather data"
-                ],
-                "completion_score": "Good"
-            }
-        }
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfileCompletenessResponse"),
+    )
+    
+    @computed_field
+    @property
+    def completion_score(self) -> str:
+        """Completion level description"""
+        percentage = self.completeness_percentage
+        for threshold, label in _COMPLETION_SCORE_BANDS:
+            if percentage >= threshold:
+                return label
+        return "Incomplete"
 
 
 class ProfilePrivacyResponse(BaseModel):
@@ -755,65 +731,50 @@ class ProfilePrivacyResponse(BaseModel):
     information about visibility controls and social permissions.
     """
     
-    profile_id: UUID = Field(
+    profile_id: str = Field(
         ...,
         description="Profile identifier",
-        example="456e7890-f12a-34b5-c678-901234567890"
+        examples=["456e7890-f12a-34b5-c678-901234567890"]
     )
-    profile_visibility: VisibilityLevel = Field(
+    profile_visibility: VisibilityValue = Field(
         ...,
         description="Overall profile visibility",
-        example=VisibilityLevel.PUBLIC
+        examples=["public"]
     )
-    bio_visibility: VisibilityLevel = Field(
+    bio_visibility: VisibilityValue = Field(
         ...,
         description="Bio visibility level",
-        example=VisibilityLevel.PUBLIC
+        examples=["public"]
     )
-    location_visibility: VisibilityLevel = Field(
+    location_visibility: VisibilityValue = Field(
         ...,
         description="Location visibility level",
-        example=VisibilityLevel.FRIENDS
+        examples=["friends"]
     )
     allow_friend_requests: bool = Field(
         ...,
         description="Allow friend requests",
-        example=True
+        examples=[True]
     )
     show_in_search: bool = Field(
         ...,
         description="Show profile in search results",
-        example=True
+        examples=[True]
     )
     allow_direct_messages: bool = Field(
         ...,
         description="Allow direct messages",
-        example=False
+        examples=[False]
     )
     updated_at: datetime = Field(
         ...,
         description="Privacy settings last updated",
-        example="2024-01-20T15:45:00Z"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "profile_id": "456e7890-f12a-34b5-c678-901234567890",
-                "profile_visibility": "public",
-                "bio_visibility": "public",
-                "location_visibility": "friends",
-                "allow_friend_requests": True,
-                "show_in_search": True,
-                "allow_direct_messages": False,
-                "updated_at": "2024-01-20T15:45:00Z"
-            }
-        }
+        examples=["2024-01-20T15:45:00Z"]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfilePrivacyResponse"),
+    )
 
 
 class ProfilePhotoResponse(BaseModel):
@@ -824,52 +785,40 @@ class ProfilePhotoResponse(BaseModel):
     and URL information for profile photo management.
     """
     
-    profile_id: UUID = Field(
+    profile_id: str = Field(
         ...,
         description="Profile identifier",
-        example="456e7890-f12a-34b5-c678-901234567890"
+        examples=["456e7890-f12a-34b5-c678-901234567890"]
     )
     photo_url: str = Field(
         ...,
         description="Uploaded photo URL",
-        example="https://supabase.co/storage/v1/object/profiles/user456/avatar_20240120.jpg"
+        examples=["https://supabase.co/storage/v1/object/profiles/user456/avatar_20240120.jpg"]
     )
     uploaded_at: datetime = Field(
         ...,
         description="Photo upload timestamp",
-        example="2024-01-20T15:30:00Z"
+        examples=["2024-01-20T15:30:00Z"]
     )
     file_size: Optional[int] = Field(
         default=None,
         description="File size in bytes",
-        example=1024000
+        examples=[1024000]
     )
     content_type: Optional[str] = Field(
         default=None,
         description="File content type",
-        example="image/jpeg"
+        examples=["image/jpeg"]
     )
     message: str = Field(
         default="Profile photo uploaded successfully",
         description="Upload confirmation message",
-        example="Profile photo uploaded successfully"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "profile_id": "456e7890-f12a-34b5-c678-901234567890",
-                "photo_url": "https://supabase.co/storage/v1/object/profiles/user456/avatar_20240120.jpg",
-                "uploaded_at": "2024-01-20T15:30:00Z",
-                "file_size": 1024000,
-                "content_type": "image/jpeg",
-                "message": "Profile photo uploaded successfully"
-            }
-        }
+        examples=["Profile photo uploaded successfully"]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfilePhotoResponse"),
+    )
 
 
 class ProfileSearchResponse(BaseModel):
@@ -880,43 +829,32 @@ class ProfileSearchResponse(BaseModel):
     information and discovery features for community interaction.
     """
     
-    profiles: List[ProfileResponse] = Field(
+    profiles: list[ProfileResponse] = Field(
         ...,
         description="List of matching profiles",
-        example=[]
+        examples=[[]]
     )
     total_count: int = Field(
         ...,
         ge=0,
         description="Total number of matching profiles",
-        example=42
+        examples=[42]
     )
-    search_metadata: Dict = Field(
+    search_metadata: Annotated[dict[str, Any], SkipValidation] = Field(
         default_factory=dict,
         description="Search execution metadata",
-        example={
+        examples=[{
             "search_time_ms": 150,
             "total_indexed": 10000,
             "matched_criteria": ["location", "completeness"]
-        }
+        }]
     )
-    suggested_searches: List[str] = Field(
+    suggested_searches: list[str] = Field(
         default_factory=list,
         description="Suggested search refinements",
-        example=["Try searching in Portland", "Look for profiles with photos"]
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "profiles": [],
-                "total_count": 42,
-                "search_metadata": {
-                    "search_time_ms": 150,
-                    "total_indexed": 10000,
-                    "matched_criteria": ["location", "completeness"]
-                },
-                "suggested_searches": ["Try searching in Portland", "Look for profiles with photos"]
-            }
-        }
\ No newline at end of file
+        examples=[["Try searching in Portland", "Look for profiles with photos"]]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("ProfileSearchResponse"),
+    )
\ No newline at end of file
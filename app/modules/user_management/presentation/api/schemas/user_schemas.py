@@ -31,9 +31,13 @@ Request Schemas:
 
 Response Schemas:
 - UserResponse: User account information with access-level filtering
+- SelfUserResponse / AdminUserResponse: Self and admin views of UserResponse
 - UserListResponse: Paginated user list with metadata
+- CompactUserResponse: Bit-packed user row for compact admin list transport
 - UserSecurityResponse: Admin-only security information
+- SecurityEvent: Security event entry (open shape until events are produced)
 - UserDeleteResponse: Account deletion confirmation
+- CleanupSummary: Fixed set of cleanup flags in a deletion confirmation
 - EmailVerificationResponse: Email verification status updates
 - AccountUnlockResponse: Account unlock confirmation
 
@@ -49,14 +53,25 @@ security measures for user account management operations.
 """
 
 from datetime import datetime
-from enum import Enum
-from typing import Dict, List, Optional
-from uuid import UUID
+from enum import StrEnum
+from typing import Annotated, Callable, Dict, Final, List, Literal, Optional, Union
 
-from pydantic import BaseModel, EmailStr, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializeAsAny,
+    SkipValidation,
+    computed_field,
+)
 
+from app.modules.user_management.presentation.api.schemas._schema_base import (
+    NormalizedEmail,
+    lazy_example,
+)
 
-class UserStatus(str, Enum):
+
+class UserStatus(StrEnum):
     """User account status enumeration."""
     ACTIVE = "active"
     INACTIVE = "inactive"
@@ -65,14 +80,14 @@ class UserStatus(str, Enum):
     SUSPENDED = "suspended"
 
 
-class UserProvider(str, Enum):
+class UserProvider(StrEnum):
     """Authentication provider enumeration."""
     EMAIL = "email"
     GOOGLE = "google"
     APPLE = "apple"
 
 
-class DeletionReason(str, Enum):
+class DeletionReason(StrEnum):
     """Account deletion reason enumeration."""
     USER_REQUEST = "user_request"
     PRIVACY_CONCERNS = "privacy_concerns"
@@ -86,6 +101,27 @@ class DeletionReason(str, Enum):
     OTHER = "other"
 
 
+# Literal counterparts used by search filters and response fields so values
+# are matched and stored as plain strings without constructing Enum members.
+UserStatusValue = Literal["active", "inactive", "locked", "pending_verification", "suspended"]
+UserProviderValue = Literal["email", "google", "apple"]
+
+
+# =============================================================================
+# SCHEMA EXAMPLES
+# =============================================================================
+
+# OpenAPI examples live in user_schema_examples.json and are only read when a
+# JSON schema is generated, so request handling never loads them.
+
+_EXAMPLES_FILE = "user_schema_examples.json"
+
+
+def _lazy_example(name: str) -> Callable[[dict], None]:
+    """Build a json_schema_extra hook that adds the named example."""
+    return lazy_example(_EXAMPLES_FILE, name)
+
+
 # =============================================================================
 # REQUEST SCHEMAS
 # =============================================================================
@@ -98,38 +134,25 @@ class UserUpdateRequest(BaseModel):
     validation and field-level permissions.
     """
     
-    email: Optional[EmailStr] = Field(
+    email: Optional[NormalizedEmail] = Field(
         default=None,
         description="Updated email address",
-        example="newemail@example.com"
+        examples=["newemail@example.com"]
     )
     email_verified: Optional[bool] = Field(
         default=None,
         description="Email verification status (admin only)",
-        example=True
+        examples=[True]
     )
     account_locked: Optional[bool] = Field(
         default=None,
         description="Account lock status (admin only)",
-        example=False
+        examples=[False]
     )
     
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "email": "newemail@example.com",
-                "email_verified": True,
-                "account_locked": False
-            }
-        }
-    
-    @validator('email')
-    def validate_email_format(cls, v):
-        """Validate email format and normalize to lowercase."""
-        if v:
-            return v.lower()
-        return v
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("UserUpdateRequest"),
+    )
 
 
 class UserDeleteRequest(BaseModel):
@@ -146,61 +169,61 @@ class UserDeleteRequest(BaseModel):
         min_length=32,
         max_length=128,
         description="Security confirmation token",
-        example="a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6q7r8s9t0u1v2w3x4y5z6"
+        examples=["a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6q7r8s9t0u1v2w3x4y5z6"]
     )
     password_confirmation: str = Field(
         ...,
         min_length=1,
         max_length=128,
         description="Current password for confirmation",
-        example="CurrentPassword123!"
+        examples=["CurrentPassword123!"]
     )
     
     # Deletion metadata
     reason: Optional[DeletionReason] = Field(
         default=DeletionReason.USER_REQUEST,
         description="Reason for account deletion",
-        example=DeletionReason.USER_REQUEST
+        examples=[DeletionReason.USER_REQUEST]
     )
     reason_details: Optional[str] = Field(
         default=None,
         max_length=1000,
         description="Additional details about deletion reason",
-        example="Moving to a different platform for plant care"
+        examples=["Moving to a different platform for plant care"]
     )
     
     # Deletion options
     hard_delete: bool = Field(
         default=False,
         description="Whether to permanently delete (true) or soft delete (false)",
-        example=False
+        examples=[False]
     )
     immediate_deletion: bool = Field(
         default=False,
         description="Skip grace period and delete immediately",
-        example=False
+        examples=[False]
     )
     
     # Cleanup options
     delete_user_data: bool = Field(
         default=True,
         description="Delete user profile and personal data",
-        example=True
+        examples=[True]
     )
     delete_subscription_data: bool = Field(
         default=True,
         description="Cancel and delete subscription information",
-        example=True
+        examples=[True]
     )
     delete_uploaded_files: bool = Field(
         default=True,
         description="Delete profile photos and uploaded files",
-        example=True
+        examples=[True]
     )
     revoke_all_sessions: bool = Field(
         default=True,
         description="Revoke all active sessions and tokens",
-        example=True
+        examples=[True]
     )
     
     # Admin fields
@@ -208,27 +231,12 @@ class UserDeleteRequest(BaseModel):
         default=None,
         max_length=500,
         description="Admin reason for deletion (admin only)",
-        example="Account violated terms of service"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        schema_extra = {
-            "example": {
-                "confirmation_token": "a1b2c3d4e5f6g7h8i9j0k1l2m3n4o5p6q7r8s9t0u1v2w3x4y5z6",
-                "password_confirmation": "CurrentPassword123!",
-                "reason": "not_using_app",
-                "reason_details": "Switching to manual plant care tracking",
-                "hard_delete": False,
-                "immediate_deletion": False,
-                "delete_user_data": True,
-                "delete_subscription_data": True,
-                "delete_uploaded_files": True,
-                "revoke_all_sessions": True,
-                "admin_reason": None
-            }
-        }
+        examples=["Account violated terms of service"]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("UserDeleteRequest"),
+    )
 
 
 class UserSearchRequest(BaseModel):
@@ -244,46 +252,46 @@ class UserSearchRequest(BaseModel):
         default=None,
         max_length=255,
         description="Search term for email or display name",
-        example="john"
+        examples=["john"]
     )
     email_filter: Optional[str] = Field(
         default=None,
         description="Filter by email domain or pattern",
-        example="@gmail.com"
+        examples=["@gmail.com"]
     )
     
     # Status filters
-    status_filter: Optional[UserStatus] = Field(
+    status_filter: Optional[UserStatusValue] = Field(
         default=None,
         description="Filter by user account status",
-        example=UserStatus.ACTIVE
+        examples=["active"]
     )
-    provider_filter: Optional[UserProvider] = Field(
+    provider_filter: Optional[UserProviderValue] = Field(
         default=None,
         description="Filter by authentication provider",
-        example=UserProvider.EMAIL
+        examples=["email"]
     )
     email_verified_filter: Optional[bool] = Field(
         default=None,
         description="Filter by email verification status",
-        example=True
+        examples=[True]
     )
     
     # Date filters
     created_after: Optional[datetime] = Field(
         default=None,
         description="Filter users created after this date",
-        example="2024-01-01T00:00:00Z"
+        examples=["2024-01-01T00:00:00Z"]
     )
     created_before: Optional[datetime] = Field(
         default=None,
         description="Filter users created before this date",
-        example="2024-12-31T23:59:59Z"
+        examples=["2024-12-31T23:59:59Z"]
     )
     last_login_after: Optional[datetime] = Field(
         default=None,
         description="Filter users with last login after this date",
-        example="2024-01-01T00:00:00Z"
+        examples=["2024-01-01T00:00:00Z"]
     )
     
     # Pagination
@@ -291,183 +299,218 @@ class UserSearchRequest(BaseModel):
         default=1,
         ge=1,
         description="Page number",
-        example=1
+        examples=[1]
     )
     page_size: int = Field(
         default=20,
         ge=1,
         le=100,
         description="Items per page",
-        example=20
+        examples=[20]
     )
     
     # Sorting
-    sort_by: str = Field(
+    sort_by: Literal["created_at", "email", "last_login_at", "display_name"] = Field(
         default="created_at",
-        description="Sort field (created_at, email, last_login_at)",
-        example="created_at"
+        description="Sort field (created_at, email, last_login_at, display_name)",
+        examples=["created_at"]
     )
-    sort_order: str = Field(
+    sort_order: Literal["asc", "desc"] = Field(
         default="desc",
         description="Sort order (asc, desc)",
-        example="desc"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "search_term": "john",
-                "status_filter": "active",
-                "provider_filter": "email",
-                "email_verified_filter": True,
-                "created_after": "2024-01-01T00:00:00Z",
-                "page": 1,
-                "page_size": 20,
-                "sort_by": "created_at",
-                "sort_order": "desc"
-            }
-        }
-    
-    @validator('sort_by')
-    def validate_sort_field(cls, v):
-        """Validate sort field options."""
-        allowed_fields = ["created_at", "email", "last_login_at", "display_name"]
-        if v not in allowed_fields:
-            raise ValueError(f"Sort field must be one of: {', '.join(allowed_fields)}")
-        return v
-    
-    @validator('sort_order')
-    def validate_sort_order(cls, v):
-        """Validate sort order options."""
-        if v not in ["asc", "desc"]:
-            raise ValueError("Sort order must be 'asc' or 'desc'")
-        return v
+        examples=["desc"]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("UserSearchRequest"),
+    )
 
 
 # =============================================================================
 # RESPONSE SCHEMAS
 # =============================================================================
 
+# Optional fields exposed at each access level, with their fallback values
+_FIELD_DEFAULTS: Final[dict] = {
+    "last_login_at": None,
+    "email_verified": False,
+    "failed_login_attempts": 0,
+    "account_locked": False,
+}
+_PUBLIC_FIELDS: Final[tuple[str, ...]] = ("last_login_at", "email_verified")
+_SELF_FIELDS: Final[tuple[str, ...]] = _PUBLIC_FIELDS + ("failed_login_attempts",)
+_ADMIN_FIELDS: Final[tuple[str, ...]] = _SELF_FIELDS + ("account_locked",)
+_LEVEL_TO_FIELDS: Final[dict[str, tuple[str, ...]]] = {
+    "public": _PUBLIC_FIELDS,
+    "self": _SELF_FIELDS,
+    "admin": _ADMIN_FIELDS,
+}
+# (field, fallback) pairs per access level, resolved once at import
+_LEVEL_TO_FIELD_DEFAULTS: Final[dict[str, tuple[tuple[str, object], ...]]] = {
+    level: tuple((name, _FIELD_DEFAULTS[name]) for name in fields)
+    for level, fields in _LEVEL_TO_FIELDS.items()
+}
+_PUBLIC_FIELD_DEFAULTS = _LEVEL_TO_FIELD_DEFAULTS["public"]
+
+# Account status keyed by (account_locked, email_verified); a lock always wins
+_STATUS_TABLE: Final[dict[tuple[bool, bool], UserStatusValue]] = {
+    (True, True): UserStatus.LOCKED.value,
+    (True, False): UserStatus.LOCKED.value,
+    (False, False): UserStatus.PENDING_VERIFICATION.value,
+    (False, True): UserStatus.ACTIVE.value,
+}
+
+
+def _project_user(user_data: Dict, access_level: str) -> dict:
+    """Select the response fields for an access level from domain user data."""
+    get = user_data.get
+    locked = get("account_locked", False)
+    verified = get("email_verified", True)
+    
+    response_data = {
+        "user_id": str(user_data["user_id"]),
+        "email": user_data["email"],
+        "created_at": user_data["created_at"],
+        "provider": get("provider", "email"),
+        "status": _STATUS_TABLE[(bool(locked), bool(verified))],
+    }
+    field_defaults = _LEVEL_TO_FIELD_DEFAULTS.get(access_level, _PUBLIC_FIELD_DEFAULTS)
+    for name, default in field_defaults:
+        response_data[name] = get(name, default)
+    return response_data
+
+
 class UserResponse(BaseModel):
     """
     User account response schema with access-level filtering.
     
-    This schema provides user account information with appropriate
-    field filtering based on the requester's access level.
+    This schema carries the public user account fields. Self and admin
+    views use the SelfUserResponse and AdminUserResponse subclasses, so
+    each access level has only the fields it exposes.
     """
     
-    user_id: UUID = Field(
+    user_id: str = Field(
         ...,
         description="User's unique identifier",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
     email: str = Field(
         ...,
         description="User's email address",
-        example="user@example.com"
+        examples=["user@example.com"]
     )
     created_at: datetime = Field(
         ...,
         description="Account creation date",
-        example="2024-01-15T10:30:00Z"
+        examples=["2024-01-15T10:30:00Z"]
     )
     last_login_at: Optional[datetime] = Field(
         default=None,
         description="Last login timestamp",
-        example="2024-01-20T14:25:00Z"
+        examples=["2024-01-20T14:25:00Z"]
     )
     email_verified: bool = Field(
         ...,
         description="Email verification status",
-        example=True
+        examples=[True]
     )
-    provider: UserProvider = Field(
+    provider: UserProviderValue = Field(
         ...,
         description="Authentication provider",
-        example=UserProvider.EMAIL
+        examples=["email"]
     )
-    status: UserStatus = Field(
+    status: UserStatusValue = Field(
         ...,
         description="Account status",
-        example=UserStatus.ACTIVE
+        examples=["active"]
     )
     
-    # Optional fields based on access level
-    failed_login_attempts: Optional[int] = Field(
-        default=None,
-        description="Failed login attempts (self/admin only)",
-        example=0
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("UserResponse"),
     )
-    account_locked: Optional[bool] = Field(
-        default=None,
-        description="Account locked status (admin only)",
-        example=False
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                "email": "user@example.com",
-                "created_at": "2024-01-15T10:30:00Z",
-                "last_login_at": "2024-01-20T14:25:00Z",
-                "email_verified": True,
-                "provider": "email",
-                "status": "active",
-                "failed_login_attempts": 0,
-                "account_locked": False
-            }
-        }
+    
+    def model_dump(self, **kwargs) -> dict:
+        """Dump without None fields such as a missing last login."""
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump(**kwargs)
+    
+    def model_dump_json(self, **kwargs) -> str:
+        """Serialize without None fields such as a missing last login."""
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
     
     @classmethod
     def from_domain_data(cls, user_data: Dict, access_level: str = "public") -> "UserResponse":
         """
         Create response from domain user data with access level filtering.
         
+        Domain data is trusted, so the response is assembled without
+        re-running field validation.
+        
         Args:
             user_data: User data from domain layer
             access_level: Access level for field filtering ("public", "self", "admin")
             
         Returns:
-            UserResponse: Filtered user response
+            UserResponse: Filtered user response of the access level's subclass
         """
-        # Determine status from user state
-        if user_data.get("account_locked", False):
-            status = UserStatus.LOCKED
-        elif not user_data.get("email_verified", True):
-            status = UserStatus.PENDING_VERIFICATION
-        else:
-            status = UserStatus.ACTIVE
-        
-        # Base response data
-        response_data = {
-            "user_id": user_data["user_id"],
-            "email": user_data["email"],
-            "created_at": user_data["created_at"],
-            "last_login_at": user_data.get("last_login_at"),
-            "email_verified": user_data.get("email_verified", False),
-            "provider": UserProvider(user_data.get("provider", "email")),
-            "status": status,
-        }
-        
-        # Add fields based on access level
-        if access_level in ["self", "admin"]:
-            response_data["failed_login_attempts"] = user_data.get("failed_login_attempts", 0)
-        
-        if access_level == "admin":
-            response_data["account_locked"] = user_data.get("account_locked", False)
+        model = _LEVEL_TO_MODEL.get(access_level, UserResponse)
+        return model.model_construct(**_project_user(user_data, access_level))
+    
+    @classmethod
+    def from_domain_data_validated(cls, user_data: Dict, access_level: str = "public") -> "UserResponse":
+        """
+        Create a fully validated response from user data of external origin.
         
-        return cls(**response_data)
+        Args:
+            user_data: User data that has not been checked by the domain layer
+            access_level: Access level for field filtering ("public", "self", "admin")
+            
+        Returns:
+            UserResponse: Filtered and validated user response
+        """
+        model = _LEVEL_TO_MODEL.get(access_level, UserResponse)
+        return model(**_project_user(user_data, access_level))
+
+
+class SelfUserResponse(UserResponse):
+    """User account response for the account owner."""
+    
+    failed_login_attempts: int = Field(
+        ...,
+        description="Failed login attempts",
+        examples=[0]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("SelfUserResponse"),
+    )
+
+
+class AdminUserResponse(SelfUserResponse):
+    """User account response for administrators."""
+    
+    account_locked: bool = Field(
+        ...,
+        description="Account locked status",
+        examples=[False]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("AdminUserResponse"),
+    )
+
+
+# Response model for each access level, matching _LEVEL_TO_FIELDS
+_LEVEL_TO_MODEL: Final[dict[str, type[UserResponse]]] = {
+    "public": UserResponse,
+    "self": SelfUserResponse,
+    "admin": AdminUserResponse,
+}
+
+# Response model for routes whose access level depends on the requester;
+# the most specific model comes first so validation keeps its extra fields
+AccessLevelUserResponse = Union[AdminUserResponse, SelfUserResponse, UserResponse]
 
 
 class UserListResponse(BaseModel):
@@ -478,77 +521,158 @@ class UserListResponse(BaseModel):
     and filtering information for administrative interfaces.
     """
     
-    users: List[UserResponse] = Field(
+    users: List[SerializeAsAny[UserResponse]] = Field(
         ...,
         description="List of users",
-        example=[]
+        examples=[[]]
     )
     total_count: int = Field(
         ...,
         ge=0,
         description="Total number of users matching criteria",
-        example=150
+        examples=[150]
     )
     page: int = Field(
         ...,
         ge=1,
         description="Current page number",
-        example=1
+        examples=[1]
     )
     page_size: int = Field(
         ...,
         ge=1,
         le=100,
         description="Number of users per page",
-        example=20
-    )
-    total_pages: int = Field(
-        ...,
-        ge=0,
-        description="Total number of pages",
-        example=8
-    )
-    has_next: bool = Field(
-        ...,
-        description="Whether there is a next page",
-        example=True
-    )
-    has_previous: bool = Field(
-        ...,
-        description="Whether there is a previous page",
-        example=False
+        examples=[20]
     )
     
-    # Filter summary
-    applied_filters: Dict = Field(
+    # Filter summary, passed through as built by the handler
+    applied_filters: Annotated[Dict, SkipValidation] = Field(
         default_factory=dict,
         description="Summary of applied filters",
-        example={"status_filter": "active", "email_verified_filter": True}
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        schema_extra = {
-            "example": {
-                "users": [
-                    {
-                        "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                        "email": "user1@example.com",
-                        "created_at": "2024-01-15T10:30:00Z",
-                        "email_verified": True,
-                        "provider": "email",
-                        "status": "active"
-                    }
-                ],
-                "total_count": 150,
-                "page": 1,
-                "page_size": 20,
-                "total_pages": 8,
-                "has_next": True,
-                "has_previous": False,
-                "applied_filters": {"status_filter": "active", "email_verified_filter": True}
-            }
-        }
+        examples=[{"status_filter": "active", "email_verified_filter": True}]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("UserListResponse"),
+    )
+    
+    @computed_field
+    @property
+    def total_pages(self) -> int:
+        """Total number of pages"""
+        return (self.total_count + self.page_size - 1) // self.page_size
+    
+    @computed_field
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a next page"""
+        return self.page < self.total_pages
+    
+    @computed_field
+    @property
+    def has_previous(self) -> bool:
+        """Whether there is a previous page"""
+        return self.page > 1
+    
+    @classmethod
+    def from_user_responses(
+        cls,
+        users: List[UserResponse],
+        total_count: int,
+        page: int,
+        page_size: int,
+        applied_filters: Optional[Dict] = None
+    ) -> "UserListResponse":
+        """
+        Assemble a page from responses built by UserResponse.from_domain_data.
+        
+        The items are already response models, so the page is constructed
+        without validating them a second time.
+        
+        Args:
+            users: User responses for the current page
+            total_count: Total number of matching users
+            page: Current page number
+            page_size: Number of items per page
+            applied_filters: Summary of applied filters
+            
+        Returns:
+            UserListResponse: Paginated user list response
+        """
+        assert all(isinstance(user, UserResponse) for user in users), (
+            "UserListResponse.from_user_responses expects UserResponse items"
+        )
+        return cls.model_construct(
+            users=users,
+            total_count=total_count,
+            page=page,
+            page_size=page_size,
+            applied_filters=applied_filters if applied_filters is not None else {},
+        )
+
+
+# Bit positions packed into CompactUserResponse.flags
+USER_FLAG_EMAIL_VERIFIED: Final[int] = 1 << 0
+USER_FLAG_ACCOUNT_LOCKED: Final[int] = 1 << 1
+USER_FLAG_HAS_RESET_TOKEN: Final[int] = 1 << 2
+
+# Accept media type that selects compact rows on the admin user list
+COMPACT_USER_MEDIA_TYPE: Final[str] = "application/vnd.plantcare.compact+json"
+
+
+class CompactUserResponse(BaseModel):
+    """
+    Compact user row for admin list transport.
+    
+    Boolean account state is packed into a single flags integer:
+    bit 0 is email_verified, bit 1 is account_locked and bit 2 is
+    has_reset_token (see the USER_FLAG_* constants).
+    """
+    
+    user_id: str = Field(..., description="User's unique identifier")
+    email: str = Field(..., description="User's email address")
+    created_at: datetime = Field(..., description="Account creation date")
+    last_login_at: Optional[datetime] = Field(default=None, description="Last login timestamp")
+    provider: UserProviderValue = Field(..., description="Authentication provider")
+    status: UserStatusValue = Field(..., description="Account status")
+    flags: int = Field(..., ge=0, description="Packed account state bits")
+    
+    @classmethod
+    def from_domain_data(cls, user_data: Dict) -> "CompactUserResponse":
+        """Create a compact row from trusted domain user data."""
+        get = user_data.get
+        locked = bool(get("account_locked"))
+        verified = bool(get("email_verified", False))
+        has_reset_token = get("reset_token") is not None
+        return cls.model_construct(
+            user_id=str(user_data["user_id"]),
+            email=user_data["email"],
+            created_at=user_data["created_at"],
+            last_login_at=get("last_login_at"),
+            provider=get("provider", "email"),
+            status=_STATUS_TABLE[(locked, bool(get("email_verified", True)))],
+            flags=(
+                verified * USER_FLAG_EMAIL_VERIFIED
+                | locked * USER_FLAG_ACCOUNT_LOCKED
+                | has_reset_token * USER_FLAG_HAS_RESET_TOKEN
+            ),
+        )
+
+
+class SecurityEvent(BaseModel):
+    """
+    Single account security event shown to administrators.
+    
+    No producer defines the event shape yet, so the documented fields are
+    optional and any other keys are passed through unchanged.
+    """
+    
+    event_type: Optional[str] = Field(default=None, description="Security event type", examples=["login_failed"])
+    at: Optional[datetime] = Field(default=None, description="When the event occurred")
+    ip: Optional[str] = Field(default=None, description="Originating IP address")
+    
+    model_config = ConfigDict(frozen=True, extra="allow")
 
 
 class UserSecurityResponse(BaseModel):
@@ -559,84 +683,79 @@ class UserSecurityResponse(BaseModel):
     monitoring and user account security management.
     """
     
-    user_id: UUID = Field(
+    user_id: str = Field(
         ...,
         description="User's unique identifier",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
     failed_login_attempts: int = Field(
         ...,
         ge=0,
         description="Failed login attempt counter",
-        example=2
+        examples=[2]
     )
     account_locked: bool = Field(
         ...,
         description="Account lock status",
-        example=False
+        examples=[False]
     )
     has_reset_token: bool = Field(
         ...,
         description="Whether user has active reset token",
-        example=False
+        examples=[False]
     )
     reset_token_expires: Optional[datetime] = Field(
         default=None,
         description="Reset token expiration",
-        example=None
+        examples=[None]
     )
     last_login_at: Optional[datetime] = Field(
         default=None,
         description="Last successful login",
-        example="2024-01-20T14:25:00Z"
+        examples=["2024-01-20T14:25:00Z"]
     )
     created_at: datetime = Field(
         ...,
         description="Account creation date",
-        example="2024-01-15T10:30:00Z"
+        examples=["2024-01-15T10:30:00Z"]
     )
     account_locked_at: datetime = Field(
         ...,
         description="Account Logged date",
-        example="2024-01-15T10:30:00Z"
+        examples=["2024-01-15T10:30:00Z"]
     )
     email_verified: bool = Field(
         ...,
         description="Email verification status",
-        example=True
+        examples=[True]
     )
-    provider: UserProvider = Field(
+    provider: UserProviderValue = Field(
         ...,
         description="Authentication provider",
-        example=UserProvider.EMAIL
+        examples=["email"]
     )
-    security_events: List[Dict] = Field(
+    security_events: List[SecurityEvent] = Field(
         default_factory=list,
         description="Recent security events",
-        example=[]
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                "failed_login_attempts": 0,
-                "account_locked": False,
-                "has_reset_token": False,
-                "reset_token_expires": None,
-                "last_login_at": "2024-01-20T14:25:00Z",
-                "created_at": "2024-01-15T10:30:00Z",
-                "email_verified": True,
-                "provider": "email",
-                "security_events": [],
-                "account_locked_at": "2024-01-20T14:25:00Z",
-            }
-        }
+        examples=[[]]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("UserSecurityResponse"),
+    )
+
+
+class CleanupSummary(BaseModel):
+    """Cleanup operations performed by an account deletion."""
+    
+    delete_user_data: bool = Field(..., description="Profile and user data deleted")
+    delete_subscription_data: bool = Field(..., description="Subscriptions cancelled")
+    delete_uploaded_files: bool = Field(..., description="Uploaded file cleanup started")
+    revoke_all_sessions: bool = Field(..., description="All sessions revoked")
+    hard_delete: bool = Field(default=False, description="Account permanently removed")
+    immediate_deletion: bool = Field(default=False, description="Grace period skipped")
+    
+    model_config = ConfigDict(extra="forbid")
 
 
 class UserDeleteResponse(BaseModel):
@@ -647,56 +766,40 @@ class UserDeleteResponse(BaseModel):
     information for security and compliance tracking.
     """
     
-    user_id: UUID = Field(
+    user_id: str = Field(
         ...,
         description="Deleted user's identifier",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
     deletion_type: str = Field(
         ...,
         description="Type of deletion performed (hard/soft)",
-        example="soft"
+        examples=["soft"]
     )
     deleted_at: datetime = Field(
         ...,
         description="Deletion timestamp",
-        example="2024-01-20T15:30:00Z"
+        examples=["2024-01-20T15:30:00Z"]
     )
-    cleanup_completed: Dict = Field(
+    cleanup_completed: CleanupSummary = Field(
         ...,
         description="Summary of cleanup operations performed",
-        example={
+        examples=[{
             "delete_user_data": True,
             "delete_subscription_data": True,
             "delete_uploaded_files": True,
             "revoke_all_sessions": True
-        }
+        }]
     )
     message: str = Field(
         default="User account deleted successfully",
         description="Deletion confirmation message",
-        example="User account deleted successfully"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                "deletion_type": "soft",
-                "deleted_at": "2024-01-20T15:30:00Z",
-                "cleanup_completed": {
-                    "delete_user_data": True,
-                    "delete_subscription_data": True,
-                    "delete_uploaded_files": True,
-                    "revoke_all_sessions": True
-                },
-                "message": "User account deleted successfully"
-            }
-        }
+        examples=["User account deleted successfully"]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("UserDeleteResponse"),
+    )
 
 
 class EmailVerificationResponse(BaseModel):
@@ -707,46 +810,35 @@ class EmailVerificationResponse(BaseModel):
     administrative email verification operations.
     """
     
-    user_id: UUID = Field(
+    user_id: str = Field(
         ...,
         description="User's unique identifier",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
     email_verified: bool = Field(
         ...,
         description="Email verification status",
-        example=True
+        examples=[True]
     )
     verified_at: datetime = Field(
         ...,
         description="Verification timestamp",
-        example="2024-01-20T15:30:00Z"
+        examples=["2024-01-20T15:30:00Z"]
     )
-    verified_by: UUID = Field(
+    verified_by: str = Field(
         ...,
         description="Admin user who performed verification",
-        example="987fcdeb-51a2-43d1-9876-ba0987654321"
+        examples=["987fcdeb-51a2-43d1-9876-ba0987654321"]
     )
     message: str = Field(
         default="Email verified successfully",
         description="Verification confirmation message",
-        example="Email verified successfully"
+        examples=["Email verified successfully"]
     )
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                "email_verified": True,
-                "verified_at": "2024-01-20T15:30:00Z",
-                "verified_by": "987fcdeb-51a2-43d1-9876-ba0987654321",
-                "message": "Email verified successfully"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("EmailVerificationResponse"),
+    )
 
 
 class AccountUnlockResponse(BaseModel):
@@ -757,55 +849,42 @@ class AccountUnlockResponse(BaseModel):
     administrative account security management.
     """
     
-    user_id: UUID = Field(
+    user_id: str = Field(
         ...,
         description="User's unique identifier",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
     account_locked: bool = Field(
         ...,
         description="Account lock status after operation",
-        example=False
+        examples=[False]
     )
     login_attempts_reset: bool = Field(
         ...,
         description="Whether login attempts were reset",
-        example=True
+        examples=[True]
     )
     unlocked_at: datetime = Field(
         ...,
         description="Unlock timestamp",
-        example="2024-01-20T15:30:00Z"
+        examples=["2024-01-20T15:30:00Z"]
     )
     account_locked_at: datetime = Field(
         ...,
         description="lock timestamp",
-        example="2024-01-20T15:30:00Z"
+        examples=["2024-01-20T15:30:00Z"]
     )
-    unlocked_by: UUID = Field(
+    unlocked_by: str = Field(
         ...,
         description="Admin user who performed unlock",
-        example="987fcdeb-51a2-43d1-9876-ba0987654321"
+        examples=["987fcdeb-51a2-43d1-9876-ba0987654321"]
     )
     message: str = Field(
         default="Account unlocked successfully",
         description="Unlock confirmation message",
-        example="Account unlocked successfully"
-    )
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-        schema_extra = {
-            "example": {
-                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                "account_locked": False,
-                "login_attempts_reset": True,
-                "unlocked_at": "2024-01-20T15:30:00Z",
-                "account_locked_at": "2024-01-20T15:30:00Z",
-                "unlocked_by": "987fcdeb-51a2-43d1-9876-ba0987654321",
-                "message": "Account unlocked successfully"
-            }
-        }
\ No newline at end of file
+        examples=["Account unlocked successfully"]
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra=_lazy_example("AccountUnlockResponse"),
+    )
\ No newline at end of file
@@ -42,7 +42,9 @@ All v1 endpoints are production-ready and follow REST conventions
 with full integration to the application layer handlers.
 """
 
-from typing import TYPE_CHECKING
+from importlib import import_module
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 if TYPE_CHECKING:
     # v1 API Routers
@@ -56,6 +58,23 @@ __all__ = [
     "profiles_router",
 ]
 
+# Module that defines each exported router, imported on first access
+_ROUTER_MODULES = {
+    "auth_router": "app.modules.user_management.presentation.api.v1.auth",
+    "users_router": "app.modules.user_management.presentation.api.v1.users",
+    "profiles_router": "app.modules.user_management.presentation.api.v1.profiles",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a v1 router on first access so its schemas build only when mounted."""
+    module_path = _ROUTER_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = getattr(import_module(module_path), name)
+    globals()[name] = router
+    return router
+
 
 # API Version Information
 API_VERSION = "1.0.0"
@@ -122,25 +141,29 @@ API_TAGS_METADATA = [
 ]
 
 
-def get_api_version_info() -> dict:
+# Version metadata is constant, so it is built once and shared read-only
+_API_VERSION_INFO: Mapping[str, Any] = MappingProxyType({
+    "version": API_VERSION,
+    "title": API_TITLE,
+    "description": API_DESCRIPTION,
+    "tags_metadata": API_TAGS_METADATA,
+    "contact": {
+        "name": "Plant Care API Support",
+        "url": "https://support.plantcare.app",
+        "email": "api-support@plantcare.app",
+    },
+    "license": {
+        "name": "MIT License",
+        "url": "https://opensource.org/licenses/MIT",
+    },
+})
+
+
+def get_api_version_info() -> Mapping[str, Any]:
     """
     Get API version information for documentation.
     
     Returns:
-        dict: API version metadata
+        Mapping[str, Any]: Read-only API version metadata
     """
-    return {
-        "version": API_VERSION,
-        "title": API_TITLE,
-        "description": API_DESCRIPTION,
-        "tags_metadata": API_TAGS_METADATA,
-        "contact": {
-            "name": "Plant Care API Support",
-            "url": "https://support.plantcare.app",
-            "email": "api-support@plantcare.app",
-        },
-        "license": {
-            "name": "MIT License",
-            "url": "https://opensource.org/licenses/MIT",
-        },
-    }
\ No newline at end of file
+    return _API_VERSION_INFO
@@ -12,7 +12,7 @@
 # - app.modules.user_management.application.handlers (command and query handlers)
 # - app.modules.user_management.application.commands (authentication commands)
 # - app.modules.user_management.presentation.api.schemas.auth_schemas (request/response schemas)
-# - slowapi for rate limiting (security standard)
+# - app.shared.core.rate_limiter for Redis-backed rate limiting (security standard)
 #
 # 🔄 Connected Modules / Calls From:
 # - app.modules.user_management.presentation.api.__init__ (router inclusion)
@@ -48,16 +48,22 @@ All endpoints follow REST conventions and integrate with the application
 layer command/query handlers for business logic execution.
 """
 
+import asyncio
+import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 import traceback
 
+import orjson
+
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
 
 from app.modules.user_management.application.commands.create_user import CreateUserCommand
 from app.modules.user_management.application.handlers.command_handlers import (
@@ -81,26 +87,246 @@ from app.modules.user_management.presentation.api.schemas.auth_schemas import (
     OAuthInitiateResponse,
     OAuthCallbackRequest,
     OAuthCallbackResponse,
+    cached_json_schema,
+    decode_login_request,
+    decode_token_refresh_request,
 )
 
 from app.modules.user_management.infrastructure.external.supabase_auth import SupabaseAuthService
-from app.modules.user_management.infrastructure.external.oauth_providers import OAuthProviderManager
-from app.shared.core.security import create_access_token, verify_password
+from app.modules.user_management.infrastructure.external.oauth_providers import (
+    SUPPORTED_OAUTH_PROVIDERS,
+    OAuthProviderManager,
+    next_oauth_state,
+)
+from app.shared.core.security import (
+    create_access_token,
+    create_refresh_token,
+    verify_dummy_password_async,
+    verify_password,
+    verify_password_async,
+)
 from app.shared.core.exceptions import AuthenticationError, ValidationError,RateLimitError
-from passlib.context import CryptContext
+from app.shared.core.rate_limiter import get_remote_address, rate_limit_dependency
+from app.shared.utils.helpers import utc_now_iso
 
 
-# Rate limiting configuration
-limiter = Limiter(key_func=get_remote_address)
+# Redis sliding-window rate limits shared across workers
+rate_limit_register = rate_limit_dependency(5, "minute", "auth:register")
+rate_limit_login = rate_limit_dependency(10, "minute", "auth:login")
+rate_limit_refresh_token = rate_limit_dependency(20, "minute", "auth:refresh_token")
+rate_limit_forgot_password = rate_limit_dependency(3, "hour", "auth:forgot_password")
 
 # Security configuration
 security = HTTPBearer()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# Create router
-auth_router = APIRouter()
+# Token lifetimes shared by register, login and refresh
+ACCESS_TTL = timedelta(hours=24)
+REFRESH_TTL = timedelta(days=30)
+ACCESS_TTL_SECONDS = int(ACCESS_TTL.total_seconds())
+
+# Fixed messages for auth failures; each failure raises a fresh HTTPException
+# so no traceback or request state outlives the request that raised it
+_INVALID_CREDS_DETAIL = "Invalid email or password"
+_ACCOUNT_LOCKED_DETAIL = "Account locked due to too many failed login attempts. Please reset your password."
+_INVALID_TOKEN_DETAIL = "Invalid or expired token"
+_INVALID_REFRESH_DETAIL = "Invalid or expired refresh token"
+
+# Pre-encoded fixed portions of the logout and password reset bodies
+_PASSWORD_RESET_MESSAGE = "If an account with that email exists, a password reset link has been sent."
+_LOGOUT_PREFIX = b'{"message":"Logout successful","logged_out_at":"'
+_LOGOUT_SUFFIX = b'"}'
+_PASSWORD_RESET_PREFIX = b'{"message":' + orjson.dumps(_PASSWORD_RESET_MESSAGE) + b',"email":'
+_PASSWORD_RESET_SENT_AT = b',"sent_at":"'
+_PASSWORD_RESET_SUFFIX = b'"}'
+
+# Provider-validated tokens, keyed by a 128-bit BLAKE2b digest of the token
+VALIDATED_TOKEN_CACHE_MAXSIZE = 10_000
+VALIDATED_TOKEN_CACHE_TTL_SECONDS = 30.0
+_VALIDATION_LOCK_STRIPES = 64
+_validated_tokens: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_validation_locks = tuple(asyncio.Lock() for _ in range(_VALIDATION_LOCK_STRIPES))
+
+# Refresh results shared by concurrent and immediately repeated refreshes
+REFRESH_RESULT_CACHE_MAXSIZE = 10_000
+REFRESH_RESULT_TTL_SECONDS = 2.0
+_refresh_inflight: "Dict[bytes, asyncio.Future]" = {}
+_recent_refreshes: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Create router (token-bearing responses are serialized with orjson)
+auth_router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+
+def _password_reset_body(email: str) -> Response:
+    """Build the PasswordResetResponse body around the pre-encoded message."""
+    body = (
+        _PASSWORD_RESET_PREFIX
+        + orjson.dumps(email)
+        + _PASSWORD_RESET_SENT_AT
+        + utc_now_iso().encode()
+        + _PASSWORD_RESET_SUFFIX
+    )
+    return Response(body, media_type="application/json")
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Key a token by a 128-bit BLAKE2b digest so raw tokens are never held."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _cached_token_data(key: bytes) -> Optional[Dict[str, Any]]:
+    """Return unexpired cached claims for a token key, dropping stale entries."""
+    entry = _validated_tokens.get(key)
+    if entry is None:
+        return None
+    expires_at, token_data = entry
+    if expires_at > time.time():
+        _validated_tokens.move_to_end(key)
+        return token_data
+    del _validated_tokens[key]
+    return None
+
+
+async def _validate_token_cached(
+    supabase_auth: SupabaseAuthService, token: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Validate a token with the auth provider, reusing recent results.
+    
+    Entries expire after VALIDATED_TOKEN_CACHE_TTL_SECONDS or at the token's
+    own exp, whichever is first. Concurrent validations of the same token
+    share a striped lock so only one provider call is made.
+    """
+    key = _token_cache_key(token)
+    token_data = _cached_token_data(key)
+    if token_data is not None:
+        return token_data
+    
+    async with _validation_locks[key[0] % _VALIDATION_LOCK_STRIPES]:
+        token_data = _cached_token_data(key)
+        if token_data is not None:
+            return token_data
+        
+        token_data = await supabase_auth.validate_token(token)
+        if token_data:
+            expires_at = time.time() + VALIDATED_TOKEN_CACHE_TTL_SECONDS
+            exp = token_data.get("exp")
+            if isinstance(exp, (int, float)):
+                expires_at = min(expires_at, exp)
+            _validated_tokens[key] = (expires_at, token_data)
+            while len(_validated_tokens) > VALIDATED_TOKEN_CACHE_MAXSIZE:
+                _validated_tokens.popitem(last=False)
+        return token_data
+
+
+def _finish_refresh(key: bytes, task: "asyncio.Future") -> None:
+    """Retire a finished refresh and keep a successful result for late retries."""
+    _refresh_inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    token_result = task.result()
+    if token_result:
+        _recent_refreshes[key] = (time.time() + REFRESH_RESULT_TTL_SECONDS, token_result)
+        while len(_recent_refreshes) > REFRESH_RESULT_CACHE_MAXSIZE:
+            _recent_refreshes.popitem(last=False)
+
+
+async def _refresh_token_shared(
+    supabase_auth: SupabaseAuthService, refresh_token: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Refresh a token with the auth provider, sharing one call per refresh token.
+    
+    Clients waking up often send the same refresh several times at once.
+    Concurrent requests await a single provider call, and a successful result
+    is reused for REFRESH_RESULT_TTL_SECONDS to absorb retries. The call is
+    shielded so one client disconnecting does not cancel it for the others.
+    """
+    key = _token_cache_key(refresh_token)
+    entry = _recent_refreshes.get(key)
+    if entry is not None:
+        expires_at, token_result = entry
+        if expires_at > time.time():
+            return token_result
+        del _recent_refreshes[key]
+    
+    task = _refresh_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(supabase_auth.refresh_token(refresh_token))
+        _refresh_inflight[key] = task
+        task.add_done_callback(lambda done: _finish_refresh(key, done))
+    return await asyncio.shield(task)
+
+
+def _json_body_openapi(model) -> Dict:
+    """Document a request body that is decoded manually instead of by FastAPI."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": cached_json_schema(model)}},
+        }
+    }
+
+
+def _make_token_pair(user_id: str) -> Tuple[str, str]:
+    """Sign the access/refresh token pair for a user from one shared subject claim."""
+    claims = {"sub": user_id}
+    return (
+        create_access_token(data=claims, expires_delta=ACCESS_TTL),
+        create_refresh_token(data=claims, expires_delta=REFRESH_TTL),
+    )
+
+
+def _login_payload(
+    access_token: str,
+    refresh_token: str,
+    user_id: str,
+    user_data: Dict,
+    trial_active_default: bool,
+) -> Dict:
+    """
+    Build the LoginResponse body as a plain dict for ORJSONResponse.
+    
+    The user ID is passed in already stringified (it is shared with the
+    token subject), and orjson encodes datetime values natively, so no
+    jsonable_encoder pass is needed before rendering.
+    """
+    email_verified = user_data["email_verified"]
+    return {
+        "access_token": access_token,
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+        "expires_in": ACCESS_TTL_SECONDS,
+        "user_id": user_id,
+        "email": user_data["email"],
+        "display_name": user_data.get("display_name"),
+        "email_verified": email_verified,
+        "requires_verification": not email_verified,
+        "trial_active": user_data.get("trial_active", trial_active_default),
+        "trial_end_date": user_data.get("trial_end_date"),
+    }
+
+
+async def get_login_data(request: Request) -> LoginRequest:
+    """Decode the login body through the msgspec fast path."""
+    try:
+        return decode_login_request(await request.body())
+    except ValueError as e:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+        )
+
+
+async def get_token_refresh_data(request: Request) -> TokenRefreshRequest:
+    """Decode the token refresh body through the msgspec fast path."""
+    try:
+        return decode_token_refresh_request(await request.body())
+    except ValueError as e:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+        )
+
+
 @auth_router.post(
     "/register",
     response_model=LoginResponse,
@@ -113,14 +339,14 @@ logger = logging.getLogger(__name__)
         409: {"description": "User already exists"},
         422: {"description": "Validation error"},
         429: {"description": "Too many registration attempts"},
-    }
+    },
+    dependencies=[Depends(rate_limit_register)],  # Core Doc security requirement
 )
-@limiter.limit("5/minute")  # Core Doc security requirement
 async def register(
     request: Request,
     registration_data: RegisterRequest,
     create_user_handler: CreateUserCommandHandler = Depends(CreateUserCommandHandler),
-) -> LoginResponse:
+) -> ORJSONResponse:
     """
     Register a new user account following Core Doc 1.1 specifications.
     
@@ -133,13 +359,13 @@ async def register(
         create_user_handler: Injected command handler for user creation
         
     Returns:
-        LoginResponse: Registration confirmation with tokens and user info
+        ORJSONResponse: LoginResponse body with tokens and user info
         
     Raises:
         HTTPException: For validation errors or existing users
     """
     try:
-        logger.info(f"User registration attempt for email: {registration_data.email}")
+        logger.info("User registration attempt for email: %s", registration_data.email)
 
         # Create user registration command
         create_command = CreateUserCommand(
@@ -159,39 +385,26 @@ async def register(
         result = await create_user_handler.handle(create_command)
         
         # Generate access tokens for new user
-        access_token = create_access_token(
-            data={"sub": str(result["user_id"])},
-            expires_delta=timedelta(hours=24)
-        )
-        refresh_token = create_access_token(
-            data={"sub": str(result["user_id"]), "type": "refresh"},
-            expires_delta=timedelta(days=30)
-        )
-        
-        logger.info(f"User registered successfully: {result['user_id']}")
-        return LoginResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer",
-            expires_in=86400,  # 24 hours in seconds
-            user_id=str(result["user_id"]),
-            email=result["email"],
-            display_name=result["display_name"],
-            email_verified=result["email_verified"],
-            requires_verification=not result["email_verified"],
-            trial_active=result.get("trial_active", True),
-            trial_end_date=result.get("trial_end_date"),
+        user_id = str(result["user_id"])
+        access_token, refresh_token = _make_token_pair(user_id)
+        
+        logger.info("User registered successfully: %s", result["user_id"])
+        return ORJSONResponse(
+            _login_payload(
+                access_token, refresh_token, user_id, result, trial_active_default=True
+            ),
+            status_code=status.HTTP_201_CREATED,
         )
         
     except ValueError as e:
-        logger.warning(f"Registration validation error: {str(e)}")
+        logger.warning("Registration validation error: %s", e)
 
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Registration error for {registration_data.email}: {str(e)}")
+        logger.error("Registration error for %s: %s", registration_data.email, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Registration failed. Please try again."
@@ -209,15 +422,16 @@ async def register(
         401: {"description": "Authentication failed"},
         423: {"description": "Account locked due to too many failed attempts"},
         429: {"description": "Too many login attempts"},
-    }
+    },
+    openapi_extra=_json_body_openapi(LoginRequest),
+    dependencies=[Depends(rate_limit_login)],  # Rate limit for login attempts
 )
-@limiter.limit("10/minute")  # Rate limit for login attempts
 async def login(
     request: Request,
-    login_data: LoginRequest,
+    login_data: LoginRequest = Depends(get_login_data),
     get_user_handler: GetUserQueryHandler = Depends(),
     supabase_auth: SupabaseAuthService = Depends(),
-) -> LoginResponse:
+) -> ORJSONResponse:
     """
     Authenticate user with email and password following Core Doc 1.1 security.
     
@@ -231,13 +445,13 @@ async def login(
         supabase_auth: Injected Supabase authentication service
         
     Returns:
-        LoginResponse: Authentication tokens and user information
+        ORJSONResponse: LoginResponse body with tokens and user information
         
     Raises:
         HTTPException: For authentication failures or account lockout
     """
     try:
-        logger.info(f"Login attempt for email: {login_data.email}")
+        logger.info("Login attempt for email: %s", login_data.email)
         
         # Get user by email
         user_query = GetUserQuery(
@@ -250,63 +464,53 @@ async def login(
         user_data = await get_user_handler.handle(user_query)
         
         if not user_data:
-            logger.warning(f"Login failed - user not found: {login_data.email}")
+            # Pay the hashing cost anyway so unknown emails are not a timing oracle
+            await verify_dummy_password_async(login_data.password)
+            logger.warning("Login failed - user not found: %s", login_data.email)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
+                detail=_INVALID_CREDS_DETAIL
             )
         
         # Check account lockout status (Core Doc 1.1 - 5 attempts)
         if user_data.get("account_locked", False):
-            logger.warning(f"Login blocked - account locked: {login_data.email}")
+            logger.warning("Login blocked - account locked: %s", login_data.email)
             raise HTTPException(
                 status_code=status.HTTP_423_LOCKED,
-                detail="Account locked due to too many failed login attempts. Please reset your password."
+                detail=_ACCOUNT_LOCKED_DETAIL
             )
         
         # Verify password
-        password_valid = pwd_context.verify(login_data.password, user_data["password_hash"])
+        password_valid = await verify_password_async(
+            login_data.password, user_data["password_hash"]
+        )
         
         if not password_valid:
             # Increment login attempts (handled by domain service)
-            logger.warning(f"Login failed - invalid password: {login_data.email}")
+            logger.warning("Login failed - invalid password: %s", login_data.email)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
+                detail=_INVALID_CREDS_DETAIL
             )
         
         # Generate tokens for successful login
-        access_token = create_access_token(
-            data={"sub": str(user_data["user_id"])},
-            expires_delta=timedelta(hours=24)
-        )
-        refresh_token = create_access_token(
-            data={"sub": str(user_data["user_id"]), "type": "refresh"},
-            expires_delta=timedelta(days=30)
-        )
+        user_id = str(user_data["user_id"])
+        access_token, refresh_token = _make_token_pair(user_id)
         
         # Update last login timestamp (handled by domain service)
         
-        logger.info(f"Login successful: {user_data['user_id']}")
-        
-        return LoginResponse(
-            access_token=access_token,
-            refresh_token=refresh_token,
-            token_type="bearer",
-            expires_in=86400,  # 24 hours in seconds
-            user_id=user_data["user_id"],
-            email=user_data["email"],
-            display_name=user_data.get("display_name"),
-            email_verified=user_data["email_verified"],
-            requires_verification=not user_data["email_verified"],
-            trial_active=user_data.get("trial_active", False),
-            trial_end_date=user_data.get("trial_end_date"),
+        logger.info("Login successful: %s", user_data["user_id"])
+        
+        return ORJSONResponse(
+            _login_payload(
+                access_token, refresh_token, user_id, user_data, trial_active_default=False
+            )
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Login error for {login_data.email}: {str(e)}")
+        logger.error("Login error for %s: %s", login_data.email, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Authentication failed. Please try again."
@@ -315,18 +519,20 @@ async def login(
 
 @auth_router.post(
     "/logout",
-    response_model=LogoutResponse,
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
     summary="User logout",
     description="Logout user and revoke authentication tokens",
     responses={
-        200: {"description": "Logout successful"},
+        204: {"description": "Logout successful; X-Logged-Out-At carries the timestamp"},
+        200: {"model": LogoutResponse, "description": "Logged out, but token revocation did not complete"},
         401: {"description": "Invalid or expired token"},
     }
 )
 async def logout(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     supabase_auth: SupabaseAuthService = Depends(),
-) -> LogoutResponse:
+) -> Response:
     """
     Logout user and revoke authentication tokens.
     
@@ -338,7 +544,8 @@ async def logout(
         supabase_auth: Injected Supabase authentication service
         
     Returns:
-        LogoutResponse: Logout confirmation
+        Response: Empty 204 on success, or a pre-encoded LogoutResponse body
+        when token revocation failed
         
     Raises:
         HTTPException: For invalid or expired tokens
@@ -347,29 +554,34 @@ async def logout(
         token = credentials.credentials
         
         # Validate and decode token
-        token_data = await supabase_auth.validate_token(token)
+        token_data = await _validate_token_cached(supabase_auth, token)
         if not token_data:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token"
+                detail=_INVALID_TOKEN_DETAIL
             )
         
         # Revoke token
         revoke_success = await supabase_auth.revoke_token(token)
+        logged_out_at = utc_now_iso()
+        
         if not revoke_success:
-            logger.warning(f"Token revocation failed for user: {token_data.get('user_id')}")
+            logger.warning("Token revocation failed for user: %s", token_data.get("user_id"))
+            body = _LOGOUT_PREFIX + logged_out_at.encode() + _LOGOUT_SUFFIX
+            return Response(body, media_type="application/json")
         
-        logger.info(f"User logged out successfully: {token_data.get('user_id')}")
+        _validated_tokens.pop(_token_cache_key(token), None)
+        logger.info("User logged out successfully: %s", token_data.get("user_id"))
         
-        return LogoutResponse(
-            message="Logout successful",
-            logged_out_at=datetime.utcnow(),
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+            headers={"X-Logged-Out-At": logged_out_at},
         )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Logout error: {str(e)}")
+        logger.error("Logout error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Logout failed. Please try again."
@@ -384,14 +596,15 @@ async def logout(
     responses={
         200: {"description": "Token refreshed successfully"},
         401: {"description": "Invalid or expired refresh token"},
-    }
+    },
+    openapi_extra=_json_body_openapi(TokenRefreshRequest),
+    dependencies=[Depends(rate_limit_refresh_token)],  # Higher limit for token refresh
 )
-@limiter.limit("20/minute")  # Higher limit for token refresh
 async def refresh_token(
     request: Request,
-    refresh_data: TokenRefreshRequest,
+    refresh_data: TokenRefreshRequest = Depends(get_token_refresh_data),
     supabase_auth: SupabaseAuthService = Depends(),
-) -> TokenRefreshResponse:
+) -> ORJSONResponse:
     """
     Refresh expired access token using refresh token.
     
@@ -404,36 +617,34 @@ async def refresh_token(
         supabase_auth: Injected Supabase authentication service
         
     Returns:
-        TokenRefreshResponse: New access token and refresh token
+        ORJSONResponse: TokenRefreshResponse body with the new tokens
         
     Raises:
         HTTPException: For invalid or expired refresh tokens
     """
     try:
         # Refresh token using Supabase
-        token_result = await supabase_auth.refresh_token(refresh_data.refresh_token)
+        token_result = await _refresh_token_shared(supabase_auth, refresh_data.refresh_token)
         
         if not token_result:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired refresh token"
+                detail=_INVALID_REFRESH_DETAIL
             )
         
-        access_token, new_refresh_token = token_result
-        
         logger.info("Token refreshed successfully")
         
-        return TokenRefreshResponse(
-            access_token=access_token,
-            refresh_token=new_refresh_token,
-            token_type="bearer",
-            expires_in=86400,  # 24 hours in seconds
-        )
+        return ORJSONResponse({
+            "access_token": token_result["access_token"],
+            "refresh_token": token_result["refresh_token"],
+            "token_type": "bearer",
+            "expires_in": token_result.get("expires_in") or ACCESS_TTL_SECONDS,
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Token refresh error: {str(e)}")
+        logger.error("Token refresh error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Token refresh failed. Please login again."
@@ -448,14 +659,14 @@ async def refresh_token(
     responses={
         200: {"description": "Password reset email sent (if email exists)"},
         429: {"description": "Too many password reset attempts"},
-    }
+    },
+    dependencies=[Depends(rate_limit_forgot_password)],  # Strict limit for password reset
 )
-@limiter.limit("3/hour")  # Strict limit for password reset
 async def forgot_password(
     request: Request,
     reset_data: PasswordResetRequest,
     supabase_auth: SupabaseAuthService = Depends(),
-) -> PasswordResetResponse:
+) -> Response:
     """
     Initiate password reset by sending reset email.
     
@@ -468,29 +679,21 @@ async def forgot_password(
         supabase_auth: Injected Supabase authentication service
         
     Returns:
-        PasswordResetResponse: Reset initiation confirmation
+        Response: Pre-encoded PasswordResetResponse body confirming initiation
     """
     try:
         # Send password reset email
         reset_sent = await supabase_auth.send_password_reset(reset_data.email)
         
         # Always return success for security (prevent user enumeration)
-        logger.info(f"Password reset requested for: {reset_data.email}")
+        logger.info("Password reset requested for: %s", reset_data.email)
         
-        return PasswordResetResponse(
-            message="If an account with that email exists, a password reset link has been sent.",
-            email=reset_data.email,
-            sent_at=datetime.utcnow(),
-        )
+        return _password_reset_body(reset_data.email)
         
     except Exception as e:
-        logger.error(f"Password reset error for {reset_data.email}: {str(e)}")
+        logger.error("Password reset error for %s: %s", reset_data.email, e)
         # Still return success for security
-        return PasswordResetResponse(
-            message="If an account with that email exists, a password reset link has been sent.",
-            email=reset_data.email,
-            sent_at=datetime.utcnow(),
-        )
+        return _password_reset_body(reset_data.email)
 
 
 @auth_router.get(
@@ -506,7 +709,7 @@ async def forgot_password(
 async def oauth_initiate(
     provider: str,
     oauth_manager: OAuthProviderManager = Depends(),
-) -> OAuthInitiateResponse:
+) -> ORJSONResponse:
     """
     Initiate OAuth authentication with external provider.
     
@@ -518,20 +721,20 @@ async def oauth_initiate(
         oauth_manager: Injected OAuth provider manager
         
     Returns:
-        OAuthInitiateResponse: OAuth authorization URL and state
+        ORJSONResponse: OAuthInitiateResponse body with URL and state
         
     Raises:
         HTTPException: For unsupported providers
     """
     try:
-        if provider not in ["google", "apple"]:
+        if provider not in SUPPORTED_OAUTH_PROVIDERS:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Unsupported OAuth provider: {provider}"
             )
         
         # Generate state parameter for CSRF protection
-        state = f"oauth_{provider}_{datetime.utcnow().timestamp()}"
+        state = next_oauth_state()
         
         # Get authorization URL from provider
         auth_url = await oauth_manager.get_authorization_url(provider, state)
@@ -542,18 +745,18 @@ async def oauth_initiate(
                 detail=f"Failed to generate OAuth URL for {provider}"
             )
         
-        logger.info(f"OAuth initiation for provider: {provider}")
+        logger.info("OAuth initiation for provider: %s", provider)
         
-        return OAuthInitiateResponse(
-            provider=provider,
-            authorization_url=auth_url,
-            state=state,
-        )
+        return ORJSONResponse({
+            "provider": provider,
+            "authorization_url": auth_url,
+            "state": state,
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"OAuth initiation error for {provider}: {str(e)}")
+        logger.error("OAuth initiation error for %s: %s", provider, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="OAuth initiation failed. Please try again."
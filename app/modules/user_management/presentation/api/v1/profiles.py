@@ -49,19 +49,29 @@ layer handlers while respecting Core Doc 1.2 privacy requirements.
 """
 
 import logging
-from typing import List, Optional
+import math
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+import orjson
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPBearer
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+import redis.asyncio as redis
 
 from app.modules.user_management.application.commands.update_profile import UpdateProfileCommand
 from app.modules.user_management.application.handlers.command_handlers import UpdateProfileCommandHandler
 from app.modules.user_management.application.handlers.query_handlers import GetProfileQueryHandler
 
 from app.modules.user_management.application.queries.get_profile import GetProfileQuery
+from app.modules.user_management.infrastructure.cache.profile_cache import (
+    cache_profile_response,
+    get_cached_profile_response,
+    invalidate_profile_response,
+)
+from app.modules.user_management.infrastructure.database.profile_repository_impl import ProfileRepositoryImpl
 
 from app.modules.user_management.presentation.api.schemas.profile_schemas import (
     ProfileResponse,
@@ -82,23 +92,151 @@ from app.modules.user_management.presentation.dependencies import (
     verify_profile_access,
 )
 
-from app.shared.infrastructure.storage.supabase_storage import upload_profile_photo, delete_profile_photo
+from app.shared.config.settings import get_settings
+from app.shared.core.dependencies import get_redis
+from app.shared.core.rate_limiter import rate_limit_dependency
+from app.shared.infrastructure.database.session import read_only_database_session
+from app.shared.infrastructure.storage.supabase_storage import (
+    delete_profile_photo,
+    upload_profile_photo as store_profile_photo,
+)
 
 logger = logging.getLogger(__name__)
 
-# Rate limiting configuration
-limiter = Limiter(key_func=get_remote_address)
+# Redis sliding-window rate limits shared across workers
+rate_limit_upload_profile_photo = rate_limit_dependency(10, "hour", "profiles:upload_profile_photo")
 
 # Security configuration
 security = HTTPBearer()
 
 # Create router
-profiles_router = APIRouter()
+profiles_router = APIRouter(default_response_class=ORJSONResponse)
+
+# Privacy settings applied until per-user settings come from the domain service
+_DEFAULT_PRIVACY_SETTINGS = MappingProxyType({
+    "bio_visibility": "public",
+    "location_visibility": "public",
+    "profile_visibility": "public",
+})
+
+# Per-endpoint GetProfileQuery templates; requests only fill in the ids
+_SELF_QUERY_TEMPLATE = GetProfileQuery.model_construct(
+    include_private_data=True,
+    include_preferences=True,
+    include_location_data=True,
+    include_notification_settings=True,
+    include_timestamps=True,
+    include_social_data=True,
+    include_computed_fields=True,  # Include completeness info
+)
+_PUBLIC_QUERY_TEMPLATE = GetProfileQuery.model_construct(
+    include_private_data=False,  # Will be determined by privacy level
+    include_preferences=False,   # Generally private
+    include_location_data=True,  # Filtered by privacy settings
+    include_notification_settings=False,  # Private
+    include_timestamps=True,
+    include_social_data=True,
+    respect_privacy_settings=True,  # Important for privacy
+    include_computed_fields=False,  # Generally private
+)
+_COMPLETENESS_QUERY_TEMPLATE = GetProfileQuery.model_construct(
+    include_computed_fields=True,  # For completeness calculation
+)
+
+# Improvement suggestions for missing profile fields, in display order
+_COMPLETENESS_SUGGESTIONS: Dict[str, str] = {
+    "bio": "Add a bio to tell others about your gardening interests",
+    "location": "Set your location to get personalized weather data",
+    "profile_photo": "Upload a profile photo to make your profile more personal",
+    "timezone": "Set your timezone for accurate plant care reminders",
+}
+
+
+def _as_uuid(value: Any) -> UUID:
+    """Coerce an id from the auth context to a UUID."""
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _profile_query(template: GetProfileQuery, is_admin: Any = False, **ids: Any) -> GetProfileQuery:
+    """Copy a query template with the request's ids and admin flag filled in."""
+    update = {k: _as_uuid(v) for k, v in ids.items()}
+    update["is_admin_request"] = bool(is_admin)
+    return template.model_copy(update=update)
+
+
+async def _stream_profile_list(
+    page: int,
+    page_size: int,
+    location: Optional[str],
+) -> AsyncIterator[bytes]:
+    """
+    Stream a ProfileListResponse body with profiles encoded one at a time.
+    
+    The count and the page are read on one session owned by the response
+    body, because request-scoped dependencies are cleaned up before a
+    StreamingResponse body is iterated. The pagination envelope is written
+    first, followed by the profiles array in the same public projection as
+    the detail endpoint. Errors while reading rows propagate so the
+    connection is aborted rather than ending in a truncated document.
+    """
+    async with read_only_database_session() as session:
+        repository = ProfileRepositoryImpl(session)
+        total_count = await repository.count_public_profiles(location)
+        total_pages = math.ceil(total_count / page_size) if total_count else 0
+        envelope = {
+            "total_count": total_count,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+            "has_next": page < total_pages,
+            "has_previous": page > 1,
+            "search_criteria": {"location": location} if location else {},
+        }
+        yield orjson.dumps(envelope)[:-1] + b',"profiles":['
+        
+        separator = b""
+        async for row in repository.stream_public_profiles(
+            location=location, limit=page_size, offset=(page - 1) * page_size
+        ):
+            profile = ProfileResponse.from_domain_data(
+                row, privacy_level="public", privacy_settings=_DEFAULT_PRIVACY_SETTINGS
+            )
+            yield separator + orjson.dumps(profile.model_dump(exclude_none=True))
+            separator = b","
+        yield b"]}"
+
+
+async def _resume_stream(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Re-emit an already read first chunk, then the rest of the stream."""
+    try:
+        yield first
+        async for chunk in rest:
+            yield chunk
+    finally:
+        await rest.aclose()
+
+
+# Profile photo upload limits; the request body is also capped at ingress by
+# RequestBodyLimitMiddleware from the same MAX_IMAGE_SIZE setting
+PROFILE_PHOTO_MAX_BYTES = get_settings().MAX_IMAGE_SIZE
+_IMAGE_SNIFF_BYTES = 12
+
+_PHOTO_TOO_LARGE = f"File size must be less than {PROFILE_PHOTO_MAX_BYTES // (1024 * 1024)}MB"
+
+
+def _is_supported_image(head: bytes) -> bool:
+    """Check the leading bytes for a JPEG, PNG or WebP signature."""
+    return (
+        head[:3] == b"\xff\xd8\xff"
+        or head[:8] == b"\x89PNG\r\n\x1a\n"
+        or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+    )
 
 
 @profiles_router.get(
     "/me",
     response_model=ProfileResponse,
+    response_model_exclude_none=True,
     summary="Get current user's profile",
     description="Get the current authenticated user's profile information",
     responses={
@@ -124,48 +262,33 @@ async def get_current_user_profile(
     Returns:
         ProfileResponse: Current user's profile with full access
     """
-    try:
-        # Create query for current user's profile
-        profile_query = GetProfileQuery(
-            user_id=current_user["user_id"],
-            requesting_user_id=current_user["user_id"],
-            is_admin_request=current_user.get("is_admin", False),
-            include_private_data=True,
-            include_preferences=True,
-            include_location_data=True,
-            include_notification_settings=True,
-            include_timestamps=True,
-            include_social_data=True,
-            include_computed_fields=True,  # Include completeness info
-        )
-        
-        profile_data = await get_profile_handler.handle(profile_query)
-        
-        if not profile_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Profile not found"
-            )
-        
-        return ProfileResponse.from_domain_data(
-            profile_data, 
-            privacy_level="self",
-            privacy_settings={}  # Full access for self
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting current user profile: {str(e)}")
+    # Create query for current user's profile
+    profile_query = _profile_query(
+        _SELF_QUERY_TEMPLATE,
+        user_id=current_user["user_id"],
+        requesting_user_id=current_user["user_id"],
+        is_admin=current_user.get("is_admin", False),
+    )
+    
+    profile_data = await get_profile_handler.handle(profile_query)
+    
+    if not profile_data:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve profile information"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
         )
+    
+    return ProfileResponse.from_domain_data(
+        profile_data, 
+        privacy_level="self",
+        privacy_settings={}  # Full access for self
+    )
 
 
 @profiles_router.get(
     "/{profile_id}",
     response_model=ProfileResponse,
+    response_model_exclude_none=True,
     summary="Get profile information",
     description="Get specific profile information (with privacy filtering)",
     responses={
@@ -179,7 +302,8 @@ async def get_profile(
     profile_id: UUID,
     current_user: dict = Depends(get_current_active_user),
     get_profile_handler: GetProfileQueryHandler = Depends(),
-) -> ProfileResponse:
+    redis_client: redis.Redis = Depends(get_redis),
+) -> Response:
     """
     Get specific profile information with privacy filtering.
     
@@ -190,74 +314,70 @@ async def get_profile(
         profile_id: UUID of the profile to retrieve
         current_user: Injected current user information
         get_profile_handler: Injected query handler for profile retrieval
+        redis_client: Injected Redis client for the response cache
         
     Returns:
-        ProfileResponse: Profile information with appropriate privacy filtering
+        Response: ProfileResponse JSON with appropriate privacy filtering
         
     Raises:
         HTTPException: For access denied or profile not found
     """
-    try:
-        # Create query with privacy considerations
-        profile_query = GetProfileQuery(
-            profile_id=profile_id,
-            requesting_user_id=current_user["user_id"],
-            is_admin_request=current_user.get("is_admin", False),
-            include_private_data=False,  # Will be determined by privacy level
-            include_preferences=False,   # Generally private
-            include_location_data=True,  # Filtered by privacy settings
-            include_notification_settings=False,  # Private
-            include_timestamps=True,
-            include_social_data=True,
-            respect_privacy_settings=True,  # Important for privacy
-            include_computed_fields=False,  # Generally private
-        )
-        
-        profile_data = await get_profile_handler.handle(profile_query)
-        
-        if not profile_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Profile not found or not accessible"
-            )
-        
-        # Determine privacy level
-        is_admin = current_user.get("is_admin", False)
-        is_self = profile_data.get("user_id") == current_user["user_id"]
-        
-        if is_admin:
-            privacy_level = "admin"
-        elif is_self:
-            privacy_level = "self"
-        else:
-            privacy_level = "public"
-        
-        # Get privacy settings (would come from domain service)
-        privacy_settings = {
-            "bio_visibility": "public",
-            "location_visibility": "public", 
-            "profile_visibility": "public",
-        }
-        
-        return ProfileResponse.from_domain_data(
-            profile_data,
-            privacy_level=privacy_level,
-            privacy_settings=privacy_settings
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting profile {profile_id}: {str(e)}")
+    # Serve from cache when the viewer's privacy level is already known:
+    # admins always get the admin view, other users get the public view
+    # unless they own the profile, in which case the self view applies.
+    is_admin = current_user.get("is_admin", False)
+    cached = await get_cached_profile_response(
+        redis_client, profile_id, "admin" if is_admin else "public"
+    )
+    if cached and not is_admin and cached["owner"] == str(current_user["user_id"]):
+        cached = await get_cached_profile_response(redis_client, profile_id, "self")
+    if cached:
+        return Response(content=cached["body"], media_type="application/json")
+    
+    # Create query with privacy considerations
+    profile_query = _profile_query(
+        _PUBLIC_QUERY_TEMPLATE,
+        profile_id=profile_id,
+        requesting_user_id=current_user["user_id"],
+        is_admin=is_admin,
+    )
+    
+    profile_data = await get_profile_handler.handle(profile_query)
+    
+    if not profile_data:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve profile information"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found or not accessible"
         )
+    
+    # Determine privacy level
+    is_self = profile_data.get("user_id") == current_user["user_id"]
+    
+    if is_admin:
+        privacy_level = "admin"
+    elif is_self:
+        privacy_level = "self"
+    else:
+        privacy_level = "public"
+    
+    # Default privacy settings until they come from the domain service
+    response = ProfileResponse.from_domain_data(
+        profile_data,
+        privacy_level=privacy_level,
+        privacy_settings=_DEFAULT_PRIVACY_SETTINGS
+    )
+    body = response.model_dump_json()
+    await cache_profile_response(
+        redis_client, profile_id, privacy_level, str(profile_data["user_id"]), body
+    )
+    
+    return Response(content=body, media_type="application/json")
 
 
 @profiles_router.put(
     "/{profile_id}",
     response_model=ProfileResponse,
+    response_model_exclude_none=True,
     summary="Update profile information",
     description="Update profile information (self or admin only)",
     responses={
@@ -266,7 +386,8 @@ async def get_profile(
         403: {"description": "Access denied"},
         404: {"description": "Profile not found"},
         422: {"description": "Validation error"},
-    }
+    },
+    dependencies=[Depends(verify_profile_access)],
 )
 async def update_profile(
     profile_id: UUID,
@@ -292,45 +413,21 @@ async def update_profile(
     Raises:
         HTTPException: For access denied, validation errors, or profile not found
     """
-    try:
-        # Verify profile access (self or admin only)
-        await verify_profile_access(current_user, profile_id)
-        
-        # Create update command
-        update_command = UpdateProfileCommand(
-            profile_id=profile_id,
-            display_name=update_data.display_name,
-            profile_photo=update_data.profile_photo,
-            bio=update_data.bio,
-            location=update_data.location,
-            timezone=update_data.timezone,
-            language=update_data.language,
-            theme=update_data.theme,
-            notification_enabled=update_data.notification_enabled,
-            clear_bio=update_data.clear_bio,
-            clear_location=update_data.clear_location,
-            clear_timezone=update_data.clear_timezone,
-            clear_profile_photo=update_data.clear_profile_photo,
-        )
-        
-        # Execute profile update
-        result = await update_profile_handler.handle(update_command)
-        
-        logger.info(f"Profile {profile_id} updated by {current_user['user_id']}")
-        
-        return ProfileResponse.from_handler_result(
-            result,
-            privacy_level="self"  # Return with self access after update
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating profile {profile_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update profile"
-        )
+    # Create update command from only the fields present in the request body
+    update_command = UpdateProfileCommand(
+        profile_id=profile_id,
+        **update_data.model_dump(exclude_unset=True),
+    )
+    
+    # Execute profile update (the handler drops the cached profile responses)
+    result = await update_profile_handler.handle(update_command)
+    
+    logger.info(f"Profile {profile_id} updated by {current_user['user_id']}")
+    
+    return ProfileResponse.from_handler_result(
+        result,
+        privacy_level="self"  # Return with self access after update
+    )
 
 
 @profiles_router.delete(
@@ -342,7 +439,8 @@ async def update_profile(
         401: {"description": "Authentication required"},
         403: {"description": "Access denied"},
         404: {"description": "Profile not found"},
-    }
+    },
+    dependencies=[Depends(verify_profile_access)],
 )
 async def delete_profile(
     profile_id: UUID,
@@ -361,27 +459,14 @@ async def delete_profile(
     Raises:
         HTTPException: For access denied or profile not found
     """
-    try:
-        # Verify profile access (self or admin only)
-        await verify_profile_access(current_user, profile_id)
-        
-        logger.info(f"Profile deletion requested for {profile_id} by {current_user['user_id']}")
-        
-        # Profile deletion typically happens as part of user deletion
-        # This endpoint would integrate with profile deletion logic
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail="Profile deletion should be done through user account deletion"
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting profile {profile_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to delete profile"
-        )
+    logger.info(f"Profile deletion requested for {profile_id} by {current_user['user_id']}")
+    
+    # Profile deletion typically happens as part of user deletion
+    # This endpoint would integrate with profile deletion logic
+    raise HTTPException(
+        status_code=status.HTTP_501_NOT_IMPLEMENTED,
+        detail="Profile deletion should be done through user account deletion"
+    )
 
 
 @profiles_router.post(
@@ -395,14 +480,15 @@ async def delete_profile(
         403: {"description": "Access denied"},
         413: {"description": "File too large"},
         422: {"description": "Invalid file type"},
-    }
+    },
+    dependencies=[Depends(rate_limit_upload_profile_photo), Depends(verify_profile_access)],  # Rate limit photo uploads
 )
-@limiter.limit("10/hour")  # Rate limit photo uploads
 async def upload_profile_photo(
     request: Request,
     profile_id: UUID,
     photo: UploadFile = File(..., description="Profile photo image"),
     current_user: dict = Depends(get_current_active_user),
+    redis_client: redis.Redis = Depends(get_redis),
 ) -> ProfilePhotoResponse:
     """
     Upload and set profile photo with validation and processing.
@@ -415,6 +501,7 @@ async def upload_profile_photo(
         profile_id: UUID of the profile to update photo for
         photo: Uploaded image file
         current_user: Injected current user information
+        redis_client: Injected Redis client for cache invalidation
         
     Returns:
         ProfilePhotoResponse: Photo upload confirmation with URL
@@ -422,53 +509,47 @@ async def upload_profile_photo(
     Raises:
         HTTPException: For access denied, invalid file, or upload errors
     """
-    try:
-        # Verify profile access (self or admin only)
-        await verify_profile_access(current_user, profile_id)
-        
-        # Validate file type and size
-        if not photo.content_type or not photo.content_type.startswith('image/'):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="File must be an image"
-            )
-        
-        # Check file size (max 5MB as per common standards)
-        if photo.size and photo.size > 5 * 1024 * 1024:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail="File size must be less than 5MB"
-            )
-        
-        # Upload to Supabase Storage
-        photo_url = await upload_profile_photo(
-            profile_id=profile_id,
-            file_content=await photo.read(),
-            file_name=photo.filename,
-            content_type=photo.content_type,
-        )
-        
-        # Update profile with new photo URL (would integrate with update handler)
-        
-        logger.info(f"Profile photo uploaded for {profile_id} by {current_user['user_id']}")
-        
-        return ProfilePhotoResponse(
-            profile_id=profile_id,
-            photo_url=photo_url,
-            uploaded_at=datetime.utcnow(),
-            file_size=photo.size,
-            content_type=photo.content_type,
-            message="Profile photo uploaded successfully",
+    # The request body was already capped by RequestBodyLimitMiddleware and
+    # has been spooled by form parsing; this checks the file part on its own
+    if photo.size and photo.size > PROFILE_PHOTO_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=_PHOTO_TOO_LARGE
         )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error uploading profile photo for {profile_id}: {str(e)}")
+    
+    # Validate file type from its magic bytes rather than the client's header
+    head = await photo.read(_IMAGE_SNIFF_BYTES)
+    if not _is_supported_image(head):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to upload profile photo"
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="File must be a JPEG, PNG or WebP image"
         )
+    await photo.seek(0)
+    
+    # The storage layer re-encodes the image, so it needs the whole file
+    photo_bytes = await photo.read()
+    
+    # Upload to Supabase Storage
+    upload_result = await store_profile_photo(
+        file_data=photo_bytes,
+        filename=photo.filename,
+        user_id=str(profile_id),
+    )
+    photo_url = upload_result["public_url"]
+    
+    # Update profile with new photo URL (would integrate with update handler)
+    await invalidate_profile_response(redis_client, profile_id)
+    
+    logger.info(f"Profile photo uploaded for {profile_id} by {current_user['user_id']}")
+    
+    return ProfilePhotoResponse.model_construct(
+        profile_id=str(profile_id),
+        photo_url=photo_url,
+        uploaded_at=datetime.now(timezone.utc),
+        file_size=len(photo_bytes),
+        content_type=photo.content_type,
+        message="Profile photo uploaded successfully",
+    )
 
 
 @profiles_router.delete(
@@ -480,11 +561,13 @@ async def upload_profile_photo(
         401: {"description": "Authentication required"},
         403: {"description": "Access denied"},
         404: {"description": "Profile or photo not found"},
-    }
+    },
+    dependencies=[Depends(verify_profile_access)],
 )
 async def remove_profile_photo(
     profile_id: UUID,
     current_user: dict = Depends(get_current_active_user),
+    redis_client: redis.Redis = Depends(get_redis),
 ) -> None:
     """
     Remove current profile photo and delete from storage.
@@ -495,32 +578,21 @@ async def remove_profile_photo(
     Args:
         profile_id: UUID of the profile to remove photo from
         current_user: Injected current user information
+        redis_client: Injected Redis client for cache invalidation
         
     Raises:
         HTTPException: For access denied or profile not found
     """
-    try:
-        # Verify profile access (self or admin only)
-        await verify_profile_access(current_user, profile_id)
-        
-        # Delete from Supabase Storage
-        deletion_success = await delete_profile_photo(profile_id)
-        
-        if not deletion_success:
-            logger.warning(f"Failed to delete profile photo file for {profile_id}")
-        
-        # Update profile to clear photo URL (would integrate with update handler)
-        
-        logger.info(f"Profile photo removed for {profile_id} by {current_user['user_id']}")
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error removing profile photo for {profile_id}: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to remove profile photo"
-        )
+    # Delete from Supabase Storage
+    deletion_success = await delete_profile_photo(profile_id)
+    
+    if not deletion_success:
+        logger.warning(f"Failed to delete profile photo file for {profile_id}")
+    
+    # Update profile to clear photo URL (would integrate with update handler)
+    await invalidate_profile_response(redis_client, profile_id)
+    
+    logger.info(f"Profile photo removed for {profile_id} by {current_user['user_id']}")
 
 
 @profiles_router.get(
@@ -533,7 +605,8 @@ async def remove_profile_photo(
         401: {"description": "Authentication required"},
         403: {"description": "Access denied"},
         404: {"description": "Profile not found"},
-    }
+    },
+    dependencies=[Depends(verify_profile_access)],
 )
 async def get_profile_completeness(
     profile_id: UUID,
@@ -557,58 +630,41 @@ async def get_profile_completeness(
     Raises:
         HTTPException: For access denied or profile not found
     """
-    try:
-        # Verify profile access (self or admin only)
-        await verify_profile_access(current_user, profile_id)
-        
-        # Get profile with completeness calculation
-        profile_query = GetProfileQuery(
-            profile_id=profile_id,
-            requesting_user_id=current_user["user_id"],
-            include_computed_fields=True,  # For completeness calculation
-        )
-        
-        profile_data = await get_profile_handler.handle(profile_query)
-        
-        if not profile_data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Profile not found"
-            )
-        
-        # Extract completeness information
-        completeness = profile_data.get("profile_completeness", {})
-        
-        # Generate improvement suggestions
-        missing_fields = completeness.get("missing_fields", [])
-        suggestions = []
-        
-        if "bio" in missing_fields:
-            suggestions.append("Add a bio to tell others about your gardening interests")
-        if "location" in missing_fields:
-            suggestions.append("Set your location to get personalized weather data")
-        if "profile_photo" in missing_fields:
-            suggestions.append("Upload a profile photo to make your profile more personal")
-        if "timezone" in missing_fields:
-            suggestions.append("Set your timezone for accurate plant care reminders")
-        
-        return ProfileCompletenessResponse(
-            profile_id=profile_id,
-            completeness_percentage=completeness.get("percentage", 0.0),
-            completed_fields=completeness.get("completed_fields", 0),
-            total_fields=completeness.get("total_fields", 0),
-            missing_fields=missing_fields,
-            suggestions=suggestions,
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting profile completeness for {profile_id}: {str(e)}")
+    # Get profile with completeness calculation
+    profile_query = _profile_query(
+        _COMPLETENESS_QUERY_TEMPLATE,
+        profile_id=profile_id,
+        requesting_user_id=current_user["user_id"],
+    )
+    
+    profile_data = await get_profile_handler.handle(profile_query)
+    
+    if not profile_data:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve profile completeness"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
         )
+    
+    # Extract completeness information
+    completeness = profile_data.get("profile_completeness", {})
+    
+    # Generate improvement suggestions
+    missing_fields = completeness.get("missing_fields", [])
+    missing = frozenset(missing_fields)
+    suggestions = [
+        suggestion
+        for field, suggestion in _COMPLETENESS_SUGGESTIONS.items()
+        if field in missing
+    ]
+    
+    return ProfileCompletenessResponse(
+        profile_id=str(profile_id),
+        completeness_percentage=completeness.get("percentage", 0.0),
+        completed_fields=completeness.get("completed_fields", 0),
+        total_fields=completeness.get("total_fields", 0),
+        missing_fields=missing_fields,
+        suggestions=suggestions,
+    )
 
 
 @profiles_router.get(
@@ -626,7 +682,7 @@ async def list_profiles(
     page_size: int = Query(20, ge=1, le=50, description="Items per page"),
     location: Optional[str] = Query(None, description="Filter by location"),
     current_user: dict = Depends(get_current_active_user),
-) -> ProfileListResponse:
+) -> StreamingResponse:
     """
     Get paginated list of public profiles for community discovery.
     
@@ -640,27 +696,15 @@ async def list_profiles(
         current_user: Injected current user information
         
     Returns:
-        ProfileListResponse: Paginated list of public profiles
+        StreamingResponse: ProfileListResponse body streamed profile by profile
     """
-    try:
-        logger.info(f"Profile list requested by {current_user['user_id']}")
-        
-        # This would integrate with profile search/list functionality
-        # For now, return empty list with proper pagination structure
-        
-        return ProfileListResponse(
-            profiles=[],
-            total_count=0,
-            page=page,
-            page_size=page_size,
-            total_pages=0,
-            has_next=False,
-            has_previous=False,
-        )
-        
-    except Exception as e:
-        logger.error(f"Error listing profiles: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve profile list"
-        )
\ No newline at end of file
+    logger.info(f"Profile list requested by {current_user['user_id']}")
+    
+    # Read the envelope before responding so a failed count is still a 500
+    body = _stream_profile_list(page, page_size, location)
+    first_chunk = await body.__anext__()
+    
+    return StreamingResponse(
+        _resume_stream(first_chunk, body),
+        media_type="application/json",
+    )
\ No newline at end of file
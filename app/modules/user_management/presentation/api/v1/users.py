@@ -52,10 +52,9 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.modules.user_management.application.commands.delete_user import DeleteUserCommand
 from app.modules.user_management.application.handlers.command_handlers import DeleteUserCommandHandler
@@ -64,6 +63,10 @@ from app.modules.user_management.application.handlers.query_handlers import GetU
 from app.modules.user_management.application.queries.get_user import GetUserQuery
 
 from app.modules.user_management.presentation.api.schemas.user_schemas import (
+    COMPACT_USER_MEDIA_TYPE,
+    AccessLevelUserResponse,
+    CompactUserResponse,
+    SelfUserResponse,
     UserResponse,
     UserListResponse,
     UserUpdateRequest,
@@ -81,21 +84,24 @@ from app.modules.user_management.presentation.dependencies import (
     verify_user_access,
 )
 
+from app.shared.core.rate_limiter import get_remote_address, rate_limit_dependency
+
 logger = logging.getLogger(__name__)
 
-# Rate limiting configuration
-limiter = Limiter(key_func=get_remote_address)
+# Redis sliding-window rate limits shared across workers
+rate_limit_delete_user = rate_limit_dependency(3, "hour", "users:delete_user")
 
 # Security configuration
 security = HTTPBearer()
 
 # Create router
-users_router = APIRouter()
+users_router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @users_router.get(
     "/me",
-    response_model=UserResponse,
+    response_model=SelfUserResponse,
+    response_model_exclude_none=True,
     summary="Get current user information",
     description="Get the current authenticated user's information",
     responses={
@@ -153,7 +159,8 @@ async def get_current_user_info(
     
 @users_router.get(
     "/{user_id}",
-    response_model=UserResponse,
+    response_model=AccessLevelUserResponse,
+    response_model_exclude_none=True,
     summary="Get user information",
     description="Get specific user information (with authorization checks)",
     responses={
@@ -231,7 +238,8 @@ async def get_user(
 
 @users_router.put(
     "/{user_id}",
-    response_model=UserResponse,
+    response_model=AccessLevelUserResponse,
+    response_model_exclude_none=True,
     summary="Update user account",
     description="Update user account information (self or admin only)",
     responses={
@@ -300,9 +308,9 @@ async def update_user(
         403: {"description": "Access denied"},
         404: {"description": "User not found"},
         422: {"description": "Validation error"},
-    }
+    },
+    dependencies=[Depends(rate_limit_delete_user)],  # Strict limit for account deletion
 )
-@limiter.limit("3/hour")  # Strict limit for account deletion
 async def delete_user(
     request: Request,
     user_id: UUID,
@@ -360,7 +368,7 @@ async def delete_user(
         logger.info(f"User {user_id} deleted by {current_user['user_id']}")
         
         return UserDeleteResponse(
-            user_id=result["user_id"],
+            user_id=str(result["user_id"]),
             deletion_type=result["deletion_type"],
             deleted_at=result["deleted_at"],
             cleanup_completed=result["cleanup_completed"],
@@ -380,8 +388,13 @@ async def delete_user(
 @users_router.get(
     "/",
     response_model=UserListResponse,
+    response_model_exclude_none=True,
     summary="List users",
-    description="Get paginated list of users (admin only)",
+    description=(
+        "Get paginated list of users (admin only). Send "
+        f"`Accept: {COMPACT_USER_MEDIA_TYPE}` to receive CompactUserResponse rows "
+        "with boolean account state packed into a flags integer."
+    ),
     responses={
         200: {"description": "Users retrieved successfully"},
         401: {"description": "Authentication required"},
@@ -389,13 +402,14 @@ async def delete_user(
     }
 )
 async def list_users(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search term for email or display name"),
     status_filter: Optional[str] = Query(None, description="Filter by user status"),
     current_admin: dict = Depends(get_current_admin_user),
     get_user_handler: GetUserQueryHandler = Depends(),
-) -> UserListResponse:
+) -> ORJSONResponse:
     """
     Get paginated list of users with filtering options (admin only).
     
@@ -403,6 +417,7 @@ async def list_users(
     with search and filtering capabilities.
     
     Args:
+        request: HTTP request, used for Accept negotiation of compact rows
         page: Page number for pagination
         page_size: Number of items per page
         search: Optional search term for email or display name
@@ -411,7 +426,7 @@ async def list_users(
         get_user_handler: Injected query handler for user retrieval
         
     Returns:
-        UserListResponse: Paginated list of users with metadata
+        ORJSONResponse: UserListResponse body with paginated users and metadata
         
     Raises:
         HTTPException: For non-admin access or system errors
@@ -421,16 +436,27 @@ async def list_users(
         
         # This would integrate with a list users query handler when implemented
         # For now, return empty list with proper pagination structure
+        user_rows: List[dict] = []
+        compact = COMPACT_USER_MEDIA_TYPE in request.headers.get("accept", "")
         
-        return UserListResponse(
-            users=[],
+        user_page = UserListResponse.from_user_responses(
+            [] if compact else [
+                UserResponse.from_domain_data(row, access_level="admin") for row in user_rows
+            ],
             total_count=0,
             page=page,
             page_size=page_size,
-            total_pages=0,
-            has_next=False,
-            has_previous=False,
         )
+        # Items are already response models, so render the dump directly
+        # instead of letting FastAPI re-validate the page against response_model
+        body = user_page.model_dump(exclude_none=True)
+        if compact:
+            body["users"] = [
+                CompactUserResponse.from_domain_data(row).model_dump(exclude_none=True)
+                for row in user_rows
+            ]
+            return ORJSONResponse(body, media_type=COMPACT_USER_MEDIA_TYPE)
+        return ORJSONResponse(body)
         
     except Exception as e:
         logger.error(f"Error listing users: {str(e)}")
@@ -476,11 +502,11 @@ async def verify_user_email(
         logger.info(f"Manual email verification for user {user_id} by admin {current_admin['user_id']}")
         
         # This would integrate with email verification command handler
-        return EmailVerificationResponse(
-            user_id=user_id,
+        return EmailVerificationResponse.model_construct(
+            user_id=str(user_id),
             email_verified=True,
-            verified_at=datetime.utcnow(),
-            verified_by=current_admin["user_id"],
+            verified_at=datetime.now(timezone.utc),
+            verified_by=str(current_admin["user_id"]),
             message="Email verified successfully",
         )
         
@@ -528,13 +554,14 @@ async def unlock_user_account(
         logger.info(f"Account unlock for user {user_id} by admin {current_admin['user_id']}")
         
         # This would integrate with account unlock command handler
-        return AccountUnlockResponse(
-            user_id=user_id,
+        now = datetime.now(timezone.utc)
+        return AccountUnlockResponse.model_construct(
+            user_id=str(user_id),
             account_locked=False,
             login_attempts_reset=True,
-            unlocked_at=datetime.utcnow(),
-            account_locked_at=datetime.utcnow(),
-            unlocked_by=current_admin["user_id"],
+            unlocked_at=now,
+            account_locked_at=now,
+            unlocked_by=str(current_admin["user_id"]),
             message="Account unlocked successfully",
         )
         
@@ -599,7 +626,7 @@ async def get_user_security(
             )
         
         return UserSecurityResponse(
-            user_id=user_id,
+            user_id=str(user_id),
             failed_login_attempts=user_data.get("failed_login_attempts", 0),
             account_locked=user_data.get("account_locked", False),
             has_reset_token=user_data.get("reset_token") is not None,
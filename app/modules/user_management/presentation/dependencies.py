@@ -270,7 +270,7 @@ async def verify_user_access(
 async def verify_profile_access(
     profile_id: str,
     current_user: CurrentUser = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    query_handler: GetProfileQueryHandler = Depends(),
 ) -> CurrentUser:
     """
     Verify user can access specified profile resource.
@@ -281,7 +281,7 @@ async def verify_profile_access(
     Args:
         profile_id: Target profile ID to access
         current_user: Current authenticated user
-        db: Database session
+        query_handler: Injected query handler for the ownership lookup
         
     Returns:
         CurrentUser: User with verified profile access
@@ -298,16 +298,24 @@ async def verify_profile_access(
         except ValueError:
             raise ValidationError("Invalid profile ID format")
         
-        # Get profile ownership information
-        query_handler = GetProfileQueryHandler(db)
-        query = GetProfileQuery(profile_id=target_profile_uuid)
+        # Get profile ownership information (system lookup, so the owner is
+        # resolved even when the profile is not publicly visible)
+        query = GetProfileQuery(
+            profile_id=target_profile_uuid,
+            requesting_user_id=current_user.user_id,
+            is_admin_request=True,
+            include_preferences=False,
+            include_location_data=False,
+            include_timestamps=False,
+            include_social_data=False,
+        )
         profile_result = await query_handler.handle(query)
         
         if not profile_result:
             raise NotFoundError("Profile not found")
         
-        current_uuid = UUID(current_user.user_id)
-        profile_owner_uuid = UUID(str(profile_result.user_id))
+        current_uuid = UUID(str(current_user.user_id))
+        profile_owner_uuid = UUID(str(profile_result["user_id"]))
         
         # Check if user owns the profile
         if current_uuid == profile_owner_uuid:
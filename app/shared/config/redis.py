@@ -141,6 +141,7 @@ class CacheConfig:
         "user_session": "user:session:{session_id}",
         "user_preferences": "user:preferences:{user_id}",
         "user_subscription": "user:subscription:{user_id}",
+        "profile_response": "user:profile:response:{profile_id}:{privacy_level}",
         
         # Plant-related caches
         "plant_library": "plant:library:{species_id}",
@@ -178,6 +179,7 @@ class CacheConfig:
         "user_session": DEFAULT_TTL * 4,  # 4 hours
         "user_preferences": DEFAULT_TTL * 2,  # 2 hours
         "user_subscription": DEFAULT_TTL,
+        "profile_response": 30,  # Short-lived; also invalidated on profile edits
         
         "plant_library": PLANT_LIBRARY_TTL,
         "plant_details": DEFAULT_TTL,
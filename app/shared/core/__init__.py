@@ -55,7 +55,9 @@ from .rate_limiter import (
     RateLimiter,
     RateLimitRule,
     RateLimitExceeded,
-    get_rate_limiter
+    get_rate_limiter,
+    get_remote_address,
+    rate_limit_dependency
 )
 
 from .event_bus import (
@@ -116,6 +118,8 @@ __all__ = [
     "RateLimitRule",
     "RateLimitExceeded",
     "get_rate_limiter",
+    "get_remote_address",
+    "rate_limit_dependency",
     
     # Event Bus
     "EventBus",
@@ -6,12 +6,13 @@ Provides user-specific and global rate limiting with Redis backend.
 import logging
 import time
 import json
-from typing import Dict, Any, Optional, List, Union
+from typing import Awaitable, Callable, Dict, Any, Optional, List, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
 import redis.asyncio as redis
+from fastapi import Request
 
 from .exceptions import RateLimitError
 from ..config.redis import get_redis_client
@@ -486,6 +487,69 @@ def rate_limit(
     return decorator
 
 
+def get_remote_address(request: Request) -> str:
+    """
+    Get the client address used to key per-IP rate limits.
+    
+    The value is computed once per request and kept on request.state, so the
+    rate limit dependency and the endpoint's audit fields share it.
+    
+    Args:
+        request: FastAPI request
+        
+    Returns:
+        str: Client IP address
+    """
+    remote_addr = getattr(request.state, "remote_addr", None)
+    if remote_addr is None:
+        remote_addr = request.client.host if request.client else "127.0.0.1"
+        request.state.remote_addr = remote_addr
+    return remote_addr
+
+
+def rate_limit_dependency(
+    limit: int,
+    window: str,
+    endpoint: str
+) -> Callable[[Request], Awaitable[None]]:
+    """
+    Build a FastAPI dependency enforcing a per-IP sliding window limit.
+    
+    The check runs the sorted-set Lua script in Redis, so the limit holds
+    across every worker and survives restarts.
+    
+    Args:
+        limit: Maximum requests allowed
+        window: Time window (second, minute, hour, day)
+        endpoint: Endpoint identifier used in the Redis key
+        
+    Returns:
+        Callable: Dependency for use with Depends()
+        
+    Raises:
+        RateLimitError: If the client exceeded the limit (HTTP 429)
+    """
+    # Fail fast on invalid configuration at import time
+    RateLimitRule("config", limit, window, endpoint)
+    
+    async def dependency(request: Request) -> None:
+        result = await get_rate_limiter().check_limit(
+            identifier=get_remote_address(request),
+            limit=limit,
+            window=window,
+            endpoint=endpoint
+        )
+        if not result.allowed:
+            raise RateLimitError(
+                message=f"Rate limit exceeded: {limit} requests per {window}",
+                limit=limit,
+                window=window,
+                retry_after=result.retry_after
+            )
+    
+    return dependency
+
+
 # Common rate limiting configurations
 RATE_LIMIT_CONFIGS = {
     "api_calls": {
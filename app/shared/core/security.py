@@ -3,13 +3,23 @@ Security utilities for JWT validation, password hashing, and encryption.
 Provides comprehensive authentication and authorization functionality.
 """
 
+import asyncio
+import base64
+import hashlib
+import hmac
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Tuple, Union
 from functools import lru_cache
 
-from passlib.context import CryptContext
-from jose import JWTError, jwt
+import bcrypt
+import orjson
+from jose import JWTError, jwk, jwt
 from fastapi import HTTPException, status
 from pydantic import BaseModel
 
@@ -17,8 +27,55 @@ from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt is CPU-bound, so hashing runs off the event loop on a pool capped
+# at the core count to avoid oversubscribing threads under login bursts
+_password_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password_hash",
+)
+
+
+def _hash_password(password: str) -> str:
+    """Hash with the native bcrypt binding."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+
+
+def _verify_password_hash(plain_password: str, hashed_password: str) -> bool:
+    """Verify against a bcrypt hash; other schemes are rejected."""
+    if not hashed_password.startswith("$2"):
+        logger.warning("Unsupported password hash scheme")
+        return False
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash of a random throwaway password at the same cost as real hashes."""
+    return _hash_password(os.urandom(16).hex())
+
+
+def _verify_dummy_password(plain_password: str) -> None:
+    """Run one full verification whose result is discarded."""
+    _verify_password_hash(plain_password, _dummy_password_hash())
+
+# Digests for the HMAC algorithms signed without going through python-jose
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# Verified-token cache bounds (short TTL keeps revocation impact small)
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 5.0
 
 class TokenData(BaseModel):
     """Token payload data structure"""
@@ -37,8 +94,84 @@ class SecurityManager:
         self.settings = get_settings()
         self.algorithm = self.settings.JWT_ALGORITHM
         self.secret_key = self.settings.JWT_SECRET_KEY
+        # Parse the signing key once instead of on every jwt.encode call
+        self._signing_key = jwk.construct(self.secret_key, self.algorithm)
+        # HMAC tokens always share one header and key, so encode the header
+        # once and clone a keyed HMAC per token instead of rebuilding both
+        digest = _HMAC_DIGESTS.get(self.algorithm)
+        self._jwt_header_b64: Optional[bytes] = None
+        self._hmac_template: Optional["hmac.HMAC"] = None
+        if digest is not None:
+            self._jwt_header_b64 = _b64url(orjson.dumps({"alg": self.algorithm, "typ": "JWT"}))
+            self._hmac_template = hmac.new(self.secret_key.encode(), digestmod=digest)
         self.access_token_expire_minutes = self.settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
         self.refresh_token_expire_days = self.settings.JWT_REFRESH_TOKEN_EXPIRE_DAYS
+        self._token_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._token_cache_lock = threading.Lock()
+    
+    def _decode_cached(self, token: str) -> Dict[str, Any]:
+        """
+        Decode a JWT, reusing recently verified claims for the same token.
+        
+        Entries are keyed by a 128-bit BLAKE2b digest of the token and expire after
+        TOKEN_CACHE_TTL_SECONDS or at the token's own exp, whichever is first.
+        
+        Raises:
+            JWTError: If the token signature or claims are invalid
+        """
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        now = time.time()
+        
+        with self._token_cache_lock:
+            entry = self._token_cache.get(key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > now:
+                    self._token_cache.move_to_end(key)
+                    return dict(payload)
+                del self._token_cache[key]
+        
+        payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        
+        expires_at = now + TOKEN_CACHE_TTL_SECONDS
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        
+        with self._token_cache_lock:
+            self._token_cache[key] = (expires_at, payload)
+            self._token_cache.move_to_end(key)
+            while len(self._token_cache) > TOKEN_CACHE_MAXSIZE:
+                self._token_cache.popitem(last=False)
+        
+        return dict(payload)
+    
+    def _encode_token(
+        self,
+        data: Dict[str, Any],
+        expires_delta: timedelta,
+        token_type: str
+    ) -> str:
+        """
+        Sign a token with integer iat/exp claims from a single clock read.
+        
+        HMAC algorithms are signed directly from the pre-encoded header and a
+        cloned keyed HMAC; other algorithms go through python-jose.
+        """
+        now = int(time.time())
+        to_encode = {
+            **data,
+            "exp": now + int(expires_delta.total_seconds()),
+            "iat": now,
+            "type": token_type,
+        }
+        if self._hmac_template is None:
+            return jwt.encode(to_encode, self._signing_key, algorithm=self.algorithm)
+        
+        signing_input = self._jwt_header_b64 + b"." + _b64url(orjson.dumps(to_encode))
+        mac = self._hmac_template.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64url(mac.digest())).decode()
     
     def create_access_token(
         self, 
@@ -56,26 +189,10 @@ class SecurityManager:
             str: Encoded JWT token
         """
         try:
-            to_encode = data.copy()
-            
-            # Set expiration time
-            if expires_delta:
-                expire = datetime.utcnow() + expires_delta
-            else:
-                expire = datetime.utcnow() + timedelta(
-                    minutes=self.access_token_expire_minutes
-                )
-            
-            to_encode.update({
-                "exp": expire,
-                "iat": datetime.utcnow(),
-                "type": "access"
-            })
-            
-            encoded_jwt = jwt.encode(
-                to_encode, 
-                self.secret_key, 
-                algorithm=self.algorithm
+            encoded_jwt = self._encode_token(
+                data,
+                expires_delta or timedelta(minutes=self.access_token_expire_minutes),
+                "access"
             )
             
             logger.debug(f"Access token created for user: {data.get('sub')}")
@@ -104,26 +221,11 @@ class SecurityManager:
             str: Encoded JWT refresh token
         """
         try:
-            to_encode = data.copy()
-            
-            # Set longer expiration for refresh token
-            if expires_delta:
-                expire = datetime.utcnow() + expires_delta
-            else:
-                expire = datetime.utcnow() + timedelta(
-                    days=self.refresh_token_expire_days
-                )
-            
-            to_encode.update({
-                "exp": expire,
-                "iat": datetime.utcnow(),
-                "type": "refresh"
-            })
-            
-            encoded_jwt = jwt.encode(
-                to_encode,
-                self.secret_key,
-                algorithm=self.algorithm
+            # Longer default expiration for refresh tokens
+            encoded_jwt = self._encode_token(
+                data,
+                expires_delta or timedelta(days=self.refresh_token_expire_days),
+                "refresh"
             )
             
             logger.debug(f"Refresh token created for user: {data.get('sub')}")
@@ -161,11 +263,7 @@ class SecurityManager:
         )
         
         try:
-            payload = jwt.decode(
-                token, 
-                self.secret_key, 
-                algorithms=[self.algorithm]
-            )
+            payload = self._decode_cached(token)
             
             # Verify token type
             if payload.get("type") != token_type:
@@ -212,7 +310,7 @@ class SecurityManager:
             str: Hashed password
         """
         try:
-            hashed = pwd_context.hash(password)
+            hashed = _hash_password(password)
             logger.debug("Password hashed successfully")
             return hashed
         except Exception as e:
@@ -234,7 +332,7 @@ class SecurityManager:
             bool: True if password matches
         """
         try:
-            is_valid = pwd_context.verify(plain_password, hashed_password)
+            is_valid = _verify_password_hash(plain_password, hashed_password)
             if is_valid:
                 logger.debug("Password verification successful")
             else:
@@ -432,6 +530,31 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return get_security_manager().verify_password(plain_password, hashed_password)
 
 
+async def get_password_hash_async(password: str) -> str:
+    """Hash password using bcrypt on the bounded password pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_pool, _hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash on the bounded password pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _password_pool, _verify_password_hash, plain_password, hashed_password
+    )
+
+
+async def verify_dummy_password_async(plain_password: str) -> None:
+    """
+    Spend one password verification when there is no account to check against.
+    
+    Login paths that reject an unknown email call this so the response takes
+    as long as a wrong password, instead of revealing which emails exist.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_password_pool, _verify_dummy_password, plain_password)
+
+
 def validate_password_strength(password: str) -> tuple[bool, list]:
     """Validate password strength."""
     return get_security_manager().validate_password_strength(password)
@@ -457,8 +580,6 @@ def decode_token(token: str) -> Optional[Dict[str, Any]]:
         Dict: Raw token payload if valid, None if invalid
     """
     try:
-        security_manager = get_security_manager()
-        payload = jwt.decode(token, security_manager.secret_key, algorithms=[security_manager.algorithm])
-        return payload
+        return get_security_manager()._decode_cached(token)
     except JWTError:
         return None
\ No newline at end of file
@@ -24,8 +24,8 @@ import hashlib
 import secrets
 import string
 import time
-from datetime import datetime, timedelta
-from functools import wraps
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache, wraps
 from typing import Any, Dict, List, Optional, Union, Callable, TypeVar, Generic
 from uuid import uuid4, uuid5, NAMESPACE_DNS
 import json
@@ -940,6 +940,22 @@ def get_age_from_date(birth_date: datetime) -> Dict[str, int]:
     }
 
 
+@lru_cache(maxsize=1)
+def _iso_for_second(bucket: int) -> str:
+    """Format a Unix second as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(bucket, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string at second resolution.
+    
+    The formatted string is cached per second, so concurrent requests within
+    the same second share one string instead of formatting it again.
+    """
+    return _iso_for_second(int(time.time()))
+
+
 # Validation and checking utilities
 def is_valid_email_domain(domain: str) -> bool:
     """Check if domain could be valid for email."""
@@ -1431,6 +1447,7 @@ __all__ = [
     'add_business_days',
     'is_business_day',
     'get_age_from_date',
+    'utc_now_iso',
     'is_valid_email_domain',
     'is_valid_url',
     'is_valid_ipv4',